@@ -12,7 +12,7 @@ from typing import Union, Any
 from sqlalchemy.engine import Engine, Connection
 from ahjo.database_utilities import (create_conn_info, create_sqlalchemy_engine, create_sqlalchemy_url)
 from ahjo.interface_methods import load_conf, load_json_conf, load_yaml_conf
-from sqlalchemy import event
+from sqlalchemy import event, MetaData, Table
 
 logger = getLogger('ahjo')
 
@@ -46,6 +46,10 @@ class Context:
         self.configuration = load_conf(config_filename)
         self.command_line_args = command_line_args
         self.conn_info = None
+        self.git_version_params = None
+        self.test_table_params = None
+        self.metadata = MetaData()
+        self.reflected_tables = {}
         if self.configuration is None:
             raise Exception("No configuration found")
         
@@ -56,6 +60,48 @@ class Context:
         return self.conn_info
     
 
+    def get_git_version_params(self) -> dict:
+        """Return Git version table parameters from configuration.
+        The parameters match the keyword arguments of ahjo.operations.update_git_version.
+        """
+        if self.git_version_params is None:
+            self.git_version_params = {
+                "git_table_schema": self.configuration.get("git_table_schema", "dbo"),
+                "git_table": self.configuration.get("git_table", "git_version"),
+                "repository": self.configuration.get("url_of_remote_git_repository"),
+                "git_version_info_path": self.configuration.get("git_version_info_path")
+            }
+        return self.git_version_params
+
+
+    def get_test_table_params(self) -> dict:
+        """Return name and schema of the test results table and view from configuration."""
+        if self.test_table_params is None:
+            self.test_table_params = {
+                "test_table_name": self.configuration.get("test_table_name", "ahjo_tests"),
+                "test_table_schema": self.configuration.get("test_table_schema", "dbo"),
+                "test_view_name": self.configuration.get("test_view_name", "vwAhjoTests"),
+                "test_view_schema": self.configuration.get("test_view_schema", "dbo")
+            }
+        return self.test_table_params
+
+
+    def reflect_table(self, table_name: str, schema: str = None) -> Table:
+        """Return table reflected from database.
+        Reflected tables are cached, so each table is loaded only once per context.
+        Raises sqlalchemy.exc.NoSuchTableError if the table does not exist.
+        """
+        key = (schema, table_name)
+        if key not in self.reflected_tables:
+            self.reflected_tables[key] = Table(
+                table_name,
+                self.metadata,
+                autoload_with = self.get_connectable(),
+                schema = schema
+            )
+        return self.reflected_tables[key]
+
+
     def get_connectable(self) -> Union[Engine, Connection]:
         """Return Engine or Connection depending on connectivity type."""
         if self.connectivity_type is None:
@@ -245,9 +291,9 @@ def merge_config_files(config_filename: str) -> dict:
 
 
 def config_is_valid(config: Union[str, dict], non_interactive: bool = False) -> bool:
-    '''Validate configuration file.'''
+    '''Validate configuration. Configuration file is loaded if config is a path.'''
 
-    config = config if isinstance(config, dict) else load_conf(config) 
+    config = config if isinstance(config, dict) else load_conf(config)
 
     # Allow only non-interactive authentication methods in non-interactive mode.
     if non_interactive:
@@ -11,6 +11,7 @@ from ahjo.database_utilities.sqla_utilities import (
     create_sqlalchemy_url,
     create_sqlalchemy_engine,
     execute_query,
+    execute_in_batches,
     execute_try_catch,
     get_schema_names,
     execute_from_file,
@@ -328,6 +328,66 @@ def execute_query(connectable: Union[Engine, Connection, Session], query: str, v
     return query_output
 
 
+def execute_in_batches(connectable: Union[Engine, Connection], query: str, variables: dict = None,
+        batch_size: int = 1000) -> int:
+    """Execute data modification statement repeatedly until it does not affect any rows.
+    Useful for data migrations of large tables, since one giant statement
+    would hold locks and transaction log for the whole table.
+
+    The statement must limit the number of affected rows with parameter :batch_size
+    and skip the rows already modified, for example:
+        UPDATE TOP (:batch_size) store.Products SET Category = 'N/A' WHERE Category IS NULL
+
+    If Engine is given, each batch is committed in its own transaction.
+    If Connection is given, batches are executed in the transaction handling of the connection.
+    In Alembic migrations, use the connection of op.get_bind() inside
+    op.get_context().autocommit_block() to commit each batch separately.
+
+    Arguments
+    ---------
+    connectable
+        SQL Alchemy Engine or Connection.
+    query
+        SQL statement to be executed.
+    variables
+        Variables for statement, in addition to batch_size.
+    batch_size
+        Maximum number of rows affected by one execution.
+
+    Returns
+    -------
+    int
+        Total number of affected rows.
+
+    Raises
+    ------
+    ValueError
+        If the driver does not report the number of affected rows, e.g. when the statement uses SET NOCOUNT ON.
+    """
+    statement = text(query) if isinstance(query, str) else query
+    parameters = {**(variables or {}), "batch_size": batch_size}
+
+    def execute_batches(connection: Connection, commit: bool) -> int:
+        total_rowcount = 0
+        while True:
+            rowcount = connection.execute(statement, parameters).rowcount
+            if commit:
+                connection.commit()
+            if rowcount == 0:
+                return total_rowcount
+            if rowcount is None or rowcount < 0:
+                raise ValueError(
+                    "Number of affected rows is not available, so the end of the batches can not be detected. "
+                    "Remove SET NOCOUNT ON from the statement."
+                )
+            total_rowcount += rowcount
+
+    if type(connectable) == Engine:
+        with connectable.connect() as connection:
+            return execute_batches(connection, commit = True)
+    return execute_batches(connectable, commit = False)
+
+
 def execute_try_catch(engine: Engine, query: str, variables: dict = None, throw: bool = False):
     """Execute query with try catch.
     If throw is set to True, raise error in case query execution fails.
@@ -6,6 +6,8 @@
 import ahjo.util.jsonc as json
 import yaml
 import os
+from copy import deepcopy
+from itertools import zip_longest
 from logging import getLogger
 from pathlib import Path
 from re import sub
@@ -14,6 +16,11 @@ from typing import Iterable, List, Union
 
 logger = getLogger('ahjo')
 
+# Parsed configuration files by (path, modification time, size, format)
+_CONF_FILE_CACHE = {}
+# Use the C implementation of the YAML loader if PyYAML is built with libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_conf(conf_file: str, key: str = 'BACKEND'):
     """ Read configuration from file (JSON, JSONC, YAML or YML). """
@@ -36,9 +43,7 @@ def load_json_conf(conf_file: str, key: str = 'BACKEND') -> dict:
     if not f_path.is_file():
         logger.error("No such file: " + f_path.absolute().as_posix())
         return None
-    with open(f_path, encoding='utf-8') as f:
-        raw_data = f.read()
-    data = json.loads(raw_data)
+    data = _load_conf_file(f_path, "json")
     key_value = data.get(key, None)
     if key_value:
         return key_value
@@ -54,8 +59,7 @@ def load_yaml_conf(conf_file: str, key: str = 'BACKEND') -> dict:
     if not f_path.is_file():
         logger.error("No such file: " + f_path.absolute().as_posix())
         return None
-    with open(f_path, encoding='utf-8') as f:
-        data = yaml.load(f, Loader=yaml.FullLoader)
+    data = _load_conf_file(f_path, "yaml")
     if isinstance(data, dict):
         key_value = data.get(key, None)
         if key_value:
@@ -63,6 +67,22 @@ def load_yaml_conf(conf_file: str, key: str = 'BACKEND') -> dict:
     return data
 
 
+def _load_conf_file(f_path: Path, conf_format: str):
+    """Parse JSON or YAML file. Parsed files are cached by path, modification time and size,
+    so a configuration file loaded multiple times in the same process is parsed only once.
+    A copy is returned, since the callers may modify the configuration.
+    """
+    f_stat = f_path.stat()
+    cache_key = (str(f_path.absolute()), f_stat.st_mtime_ns, f_stat.st_size, conf_format)
+    if cache_key not in _CONF_FILE_CACHE:
+        with open(f_path, encoding='utf-8') as f:
+            if conf_format == "json":
+                _CONF_FILE_CACHE[cache_key] = json.loads(f.read())
+            else:
+                _CONF_FILE_CACHE[cache_key] = yaml.load(f, Loader=_YAML_LOADER)
+    return deepcopy(_CONF_FILE_CACHE[cache_key])
+
+
 def get_config_path(config_filename: str) -> str:
     '''Get configuration filename from environment variable if not given as argument.'''
     if config_filename is None and 'AHJO_CONFIG_PATH' in os.environ:
@@ -148,17 +168,13 @@ def format_to_table(lst_of_iter: List[Iterable]) -> str:
     """Format list of iterables to nice human-readable table."""
     if not lst_of_iter:
         return 'No output.'
-    col_widths = [0]*len(lst_of_iter[0])
-    for row in lst_of_iter:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-    col_formats = [f"{{:<{width + 2}}}" for width in col_widths]
-    formatted_output = ''
-    for row in lst_of_iter:
-        for i, cell in enumerate(row):
-            formatted_output += col_formats[i].format(str(cell))
-        formatted_output += '\n'
-    return formatted_output
+    str_rows = [[str(cell) for cell in row] for row in lst_of_iter]
+    # Rows may have different lengths, e.g. when the output of multiple batches is combined
+    col_widths = [max(map(len, col)) + 2 for col in zip_longest(*str_rows, fillvalue='')]
+    return ''.join(
+        ''.join(cell.ljust(width) for cell, width in zip(row, col_widths)) + '\n'
+        for row in str_rows
+    )
 
 
 def rearrange_params(kwarg_map):
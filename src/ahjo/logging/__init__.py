@@ -12,6 +12,28 @@ from ahjo.logging.db_logger import load_log_table
 from ahjo.database_utilities.sqla_utilities import database_exists
 
 
+ROOT_LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": True,
+    "root": {
+        "level": "WARN",
+        "handlers": ["console"]
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "stream": "ext://sys.stdout",
+            "level": "INFO",
+            "formatter": "console"
+        }
+    },
+    "formatters": {
+        "console": {
+            "format": "%(message)s"
+        }
+    }
+}
+
 AHJO_LOG_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -93,7 +115,7 @@ def setup_ahjo_logger(enable_database_log: bool = True, enable_windows_event_log
     """
     try:
         # Load root logger configuration
-        fileConfig(os.path.join(os.path.dirname(ahjo.__file__), 'resources/logger_root.ini'))
+        dictConfig(ROOT_LOG_CONFIG)
 
         # Setup optional loggers
         if enable_database_log:
@@ -17,6 +17,7 @@ from ahjo.operations.general import (
     populate_project,
     bulk_insert_into_database,
     drop_sqlfile_objects,
+    drop_sqlfile_objects_batch,
     deploy_sqlfiles,
     upgrade,
     alembic_command,
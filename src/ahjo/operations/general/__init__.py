@@ -31,6 +31,7 @@ from ahjo.operations.general.initialization import (
 from ahjo.operations.general.sqlfiles import (
     deploy_sqlfiles,
     drop_sqlfile_objects,
+    drop_sqlfile_objects_batch,
     deploy_sql_from_file,
     create_dependency_graph
 )
@@ -14,10 +14,10 @@ from ahjo.database_utilities import execute_query
 from ahjo.operation_manager import OperationManager
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine import Connection
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from alembic import command
-from alembic.config import Config
+if TYPE_CHECKING:
+    from alembic.config import Config
 
 ALEMBIC_API_COMMANDS = {
     "check", "upgrade", "downgrade", "current", "history", "heads", "branches", "stamp", 
@@ -27,7 +27,7 @@ ALEMBIC_API_COMMANDS = {
 logger = getLogger('ahjo')
 
 
-def alembic_config(config_filename: str, connection: Connection = None) -> Config:
+def alembic_config(config_filename: str, connection: Connection = None) -> "Config":
     """Return altered Alembic config.
 
     First, read project's alembic configuration (alembic.ini).
@@ -37,7 +37,11 @@ def alembic_config(config_filename: str, connection: Connection = None) -> Confi
 
     This way Alembic will use Ahjo's loggers and project's configurations
     when running Alembic operations.
+
+    Alembic is imported here instead of module level,
+    so that it is loaded only when an Alembic operation is run.
     """
+    from alembic.config import Config
     config = Config('alembic.ini')
     main_section = config.config_ini_section
     # main section options are set when main section is read
@@ -72,6 +76,7 @@ def alembic_command(config_filename: str, command_name: str, connection: Connect
     """
     if command_name not in ALEMBIC_API_COMMANDS:
         raise ValueError(f"Command {command_name} not in Alembic API commands.")
+    from alembic import command
     with OperationManager(f"Running Alembic command: {command_name}"):
         getattr(command, command_name)(
             config = alembic_config(
@@ -87,6 +92,7 @@ def upgrade_db_to_latest_alembic_version(config_filename: str, connection: Conne
     """Run Alembic 'upgrade head' in the same python-process
     by calling Alembic's API.
     """
+    from alembic import command
     with OperationManager("Running all upgrade migrations"):
         command.upgrade(alembic_config(config_filename, connection = connection), 'head')
 
@@ -95,6 +101,7 @@ def downgrade_db_to_alembic_base(config_filename: str, connection: Connection =
     """Run Alembic 'downgrade base' in the same python-process
     by calling Alembic's API.
     """
+    from alembic import command
     with OperationManager('Downgrading to base'):
         command.downgrade(alembic_config(config_filename, connection = connection), 'base')
 
@@ -184,7 +184,7 @@ class DatabaseTester:
 
 
     def save_results_to_db(self, file_results: dict):
-        """Save the test results to the database. Commits after saving the file output to the database table if connectable is Engine.
+        """Save the test results to the database. Commits after saving the output of all files to the database table if connectable is Engine.
         
         Arguments:
         -----------
@@ -192,58 +192,68 @@ class DatabaseTester:
             Dict where key is the test file name and value is the test result. 
         """
         try:
-            connectable = self.connectable
-            connection = connectable.connect() if type(connectable) == Engine else connectable
-
-            # Get test table columns
-            test_table_columns = [column.name for column in self.table.columns]
-
-            # Output format: Dict where key is the test file name and value is the test result.
-            for filepath, output in file_results.items():
-
-                # Get the next available batch_id
-                batch_id = None
-                if "batch_id" in test_table_columns:
-                    batch_id = connection.execute(text(f"SELECT MAX(batch_id) + 1 FROM {self.table.fullname}")).scalar()
-                    batch_id = 1 if batch_id is None else batch_id
-
-                # Get the first row of the output as column names
-                output_columns = output[0]
-                
-                # Get the intersection of the output columns and the table columns and get the indices of the columns to match the data
-                columns = []
-                column_indices = []
-                for i, column in enumerate(output_columns):
-                    if column in test_table_columns:
-                        columns.append(column)
-                        column_indices.append(i)
-
-                if len(columns) == 0:
-                    raise ValueError(f"No matching columns between the test output and the test table columns. Test output columns: {output_columns}, table columns: {test_table_columns}")
-                
-                # Create a list of dictionaries where key is the column name and value is the result data
-                insert_list = []
-                for row in output[1:]:
-
-                    row_dict = {}
-                    for i, column in zip(column_indices, columns):
-                        row_dict[column] = row[i]
-
-                    # Add batch_id to the row
-                    if "batch_id" in test_table_columns and "batch_id" not in output_columns:
-                        row_dict["batch_id"] = batch_id
-
-                    # Add the test file name to the row
-                    if "test_file" in test_table_columns and "test_file" not in output_columns:
-                        row_dict["test_file"] = filepath
-
-                    insert_list.append(row_dict)
-                
-                # Save the results to the database
-                connection.execute(insert(self.table), insert_list)
-                if type(connectable) == Engine:
+            if type(self.connectable) == Engine:
+                with self.connectable.connect() as connection:
+                    self.insert_results(connection, file_results)
                     connection.commit()
+            else:
+                self.insert_results(self.connectable, file_results)
 
         except Exception as e:
             logger.error(f"Error saving test results to the database: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+
+    def insert_results(self, connection: Connection, file_results: dict):
+        """Insert the test results to the test table. The rows of each file are inserted with a single executemany.
+        
+        Arguments:
+        -----------
+        connection: Connection
+            SQLAlchemy Connection object used for the inserts.
+        file_results: dict
+            Dict where key is the test file name and value is the test result. 
+        """
+        # Get test table columns
+        test_table_columns = [column.name for column in self.table.columns]
+
+        # Output format: Dict where key is the test file name and value is the test result.
+        for filepath, output in file_results.items():
+
+            # Get the next available batch_id
+            batch_id = None
+            if "batch_id" in test_table_columns:
+                batch_id = connection.execute(text(f"SELECT MAX(batch_id) + 1 FROM {self.table.fullname}")).scalar()
+                batch_id = 1 if batch_id is None else batch_id
+
+            # Get the first row of the output as column names
+            output_columns = output[0]
+            
+            # Get the intersection of the output columns and the table columns and get the indices of the columns to match the data
+            columns = []
+            column_indices = []
+            for i, column in enumerate(output_columns):
+                if column in test_table_columns:
+                    columns.append(column)
+                    column_indices.append(i)
+
+            if len(columns) == 0:
+                raise ValueError(f"No matching columns between the test output and the test table columns. Test output columns: {output_columns}, table columns: {test_table_columns}")
+            
+            # Values that are the same for every row of the file
+            constant_values = {}
+            if "batch_id" in test_table_columns and "batch_id" not in output_columns:
+                constant_values["batch_id"] = batch_id
+            if "test_file" in test_table_columns and "test_file" not in output_columns:
+                constant_values["test_file"] = filepath
+
+            # Create a list of dictionaries where key is the column name and value is the result data
+            insert_list = [
+                {**{column: row[i] for i, column in zip(column_indices, columns)}, **constant_values}
+                for row in output[1:]
+            ]
+            if len(insert_list) == 0:
+                continue
+
+            # Save the results to the database
+            connection.execute(insert(self.table), insert_list)
@@ -6,10 +6,15 @@
 """ Module for scanning ahjo project files. """
 import os
 import re
+import shutil
+import tempfile
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from logging import getLogger
-from ahjo.operations.general.git_version import _get_files_in_staging_area, _get_files_in_working_directory
+from ahjo.interface_methods import _YAML_LOADER
+from ahjo.util.git import _get_files_to_scan
 
 logger = getLogger("ahjo")
 
@@ -22,6 +27,11 @@ RULE_DESCRIPTIONS = {
     "sql_object_modification": "Database object modification (SQL Server)",
     "alembic_table_modification": "Database table modification (Alembic)",
 }
+BINARY_FILE_EXTENSIONS = {
+    ".7z", ".bak", ".bmp", ".dll", ".docx", ".exe", ".gif", ".gz", ".ico", ".jpeg", ".jpg", ".mdf", ".ldf",
+    ".msi", ".pdb", ".pdf", ".png", ".pptx", ".pyc", ".tar", ".xlsx", ".zip"
+}
+BINARY_SNIFF_BYTES = 512
 SEARCH_PATTERNS = {
     "hetu": r"(0[1-9]|[1-2]\d|3[01])(0[1-9]|1[0-2])(\d\d)([-+A-FU-Y])(\d\d\d)([0-9A-FHJ-NPR-Y])",
     "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b',
@@ -46,11 +56,15 @@ class AhjoScan:
             Log scan status info. This is disabled when running in quiet mode (e.g. pre-commit hook).
         ignore_config_path
             Path to the file containing ignored results.
+        workers
+            Number of processes used for scanning the files.
+        max_file_size
+            Files larger than this (in bytes) are not scanned.
     """
 
     def __init__(self, scan_staging_area: bool = False, search_rules: list = DEFAULT_SCAN_RULES, 
         log_additional_info: bool = True, ignore_config_path: str = "ahjo_scan_ignore.yaml", scan_rules_file: str = "ahjo_scan_rules.yaml",
-        add_results_to_ignore: bool = False):
+        add_results_to_ignore: bool = False, workers: int = 1, max_file_size: int = None):
         """ Constructor for AhjoScan class. 
 
         Parameters
@@ -67,6 +81,10 @@ class AhjoScan:
             Path to the file containing ignored results.
         add_results_to_ignore
             Add found scan results to ignore config file.
+        workers
+            Number of processes used for scanning the files. If 1, the files are scanned in the current process.
+        max_file_size
+            Files larger than this (in bytes) are not scanned. If None, files of any size are scanned.
         """
         self.scan_staging_area = scan_staging_area
         self.search_rules = search_rules
@@ -74,6 +92,8 @@ class AhjoScan:
         self.ignore_config_path = ignore_config_path
         self.scan_rules_file = scan_rules_file
         self.add_results_to_ignore = add_results_to_ignore
+        self.workers = workers
+        self.max_file_size = max_file_size
         self.matches = None
 
 
@@ -176,99 +196,161 @@ class AhjoScan:
             logger.warning("Scan aborted.")
             return None
 
-        # Collect filepaths to scan
-        filepaths = []
-        for rule in self.search_rules:
-            rule_filepath = rule.get("filepath")
-            if isinstance(rule_filepath, str):
-                filepaths.append(rule_filepath)
-            elif isinstance(rule_filepath, list):
-                filepaths.extend(rule_filepath)
-            else:
-                filepaths.append(".") # scan all files if no file path is specified
-
-        if self.scan_staging_area:
-            git_files = _get_files_in_staging_area(filepaths) if len(filepaths) > 0 else _get_files_in_staging_area()
-        else:
-            git_files = _get_files_in_working_directory(filepaths) if len(filepaths) > 0 else _get_files_in_working_directory()
-
-        git_files = [git_file for git_file in git_files if git_file] # Remove possible empty strings from git_files
+        git_files = self.get_files_to_scan()
         ignored_items = self.load_ignored_items()
         matches = {} # dictionary containing matches for each file and search rule
         n_matches = 0 # number of matches
         n_ignored = 0 # number of ignored matches/rules
         self.add_placeholders_to_patterns()
+        compiled_rules = self.compile_search_rules()
+
+        # Scan each file, in parallel processes if more than one worker is used
+        if self.workers > 1 and len(git_files) > 1:
+            with ProcessPoolExecutor(max_workers = self.workers) as executor:
+                file_results = list(executor.map(
+                    partial(self.scan_file, compiled_rules = compiled_rules, ignored_items = ignored_items),
+                    git_files,
+                    chunksize = max(1, len(git_files) // (self.workers * 4))
+                ))
+        else:
+            file_results = [self.scan_file(git_file, compiled_rules, ignored_items) for git_file in git_files]
+
+        for git_file, (file_matches, n_file_matches, n_file_ignored) in zip(git_files, file_results):
+            if file_matches:
+                matches[git_file] = file_matches
+            n_matches += n_file_matches
+            n_ignored += n_file_ignored
+
+        self.log_scan_results(matches, n_matches, str(datetime.now() - start_time), n_ignored)
+        matches_found = n_matches > 0
+        if self.log_additional_info:
+            self.log_scan_status_info(matches_found)
+
+        if self.add_results_to_ignore and matches_found:
+            self.add_results_to_ignore_list(matches, ignored_items)
+
+        return matches
+
+
+    def get_files_to_scan(self) -> list:
+        ''' List the git files in the file paths of the search rules.
+        Files are listed from the staging area if scan_staging_area is set, otherwise from the current commit.
+
+        Returns
+        -------
+        git_files
+            List of file paths.
+        '''
+        return _get_files_to_scan(self.search_rules, self.scan_staging_area)
+
+
+    def scan_file(self, git_file: str, compiled_rules: list, ignored_items: dict) -> tuple:
+        """ Scan a single file using compiled search rules.
+
+        Parameters
+        ----------
+        git_file
+            Path of the file to scan.
+        compiled_rules
+            Search rules compiled with compile_search_rules.
+        ignored_items
+            Dictionary containing ignored matches or rules for each file.
+
+        Returns
+        -------
+        file_matches
+            Dictionary containing matches for each search rule.
+        n_matches
+            Number of matches.
+        n_ignored
+            Number of ignored matches/rules.
+        """
+        file_matches = {}
+        n_matches = 0
+        n_ignored = 0
+
+        # Select the search rules that are not ignored and apply to the file path
+        file_rules = []
+        for search_rule_name, filepath_patterns, search_pattern in compiled_rules:
 
-        # Scan each file
-        for git_file in git_files:
+            # Check if file is in ignored rules
+            if self.file_in_ignored_list(git_file, ignored_items, ignore_type = "rules", rule_name = search_rule_name):
+                n_ignored += 1
+                continue
+
+            # Check if git_file is in search rule file path
+            if search_pattern is None or not any(filepath_pattern.search(git_file) for filepath_pattern in filepath_patterns):
+                continue
+
+            file_rules.append((search_rule_name, search_pattern))
+
+        # Load file content only if some of the search rules apply to the file
+        if len(file_rules) == 0 or self.skip_file(git_file):
+            return file_matches, n_matches, n_ignored
 
-            try: # Load file content
-                with open(git_file, "r") as f:
-                    file_content = f.read()
-            except:
-                logger.debug(f"Failed to load file: {git_file}")
-                continue  
+        try: # Load file content
+            with open(git_file, "r") as f:
+                file_content = f.read()
+        except:
+            logger.debug(f"Failed to load file: {git_file}")
+            return file_matches, n_matches, n_ignored
+
+        # Skip binary files that happen to decode as text
+        if "\x00" in file_content[:BINARY_SNIFF_BYTES]:
+            logger.debug(f"Skipping binary file: {git_file}")
+            return file_matches, n_matches, n_ignored
+
+        # Iterate through search rules
+        for search_rule_name, search_pattern in file_rules:
 
-            # Iterate through search rules
-            for search_rule in self.search_rules:
-                
-                search_rule_name = search_rule.get("name")
+            # Iterate through matches in file content using search rule pattern
+            for file_content_match in search_pattern.finditer(file_content): 
 
-                # Check if file is in ignored rules
-                if self.file_in_ignored_list(git_file, ignored_items, ignore_type = "rules", rule_name = search_rule_name):
+                match = file_content_match.group(0)
+
+                # Check if file match string is in ignored matches
+                if self.file_in_ignored_list(git_file, ignored_items, ignore_type = "matches", match = match.strip()):
                     n_ignored += 1
                     continue
-
-                # Check if git_file is in search rule file path
-                rule_filepaths = search_rule.get("filepath", ".")
-                if isinstance(rule_filepaths, str): rule_filepaths = [rule_filepaths]
-                if not any([re.search(rule_filepath, git_file) for rule_filepath in rule_filepaths]):
+                            
+                # Validate match
+                if search_rule_name == "hetu" and not self.is_hetu(match):
                     continue
 
-                # Get search rule pattern
-                search_rule_pattern = search_rule.get("pattern") # Custom search
-                if not search_rule_pattern:
-                    search_rule_pattern = SEARCH_PATTERNS.get(search_rule_name)
-                if not search_rule_pattern:
-                    logger.warning(f"Invalid search rule: {search_rule_name}. Search rule pattern not found.")
-                    continue
+                # Add match to results
+                if search_rule_name not in file_matches:
+                    file_matches[search_rule_name] = []
+                file_matches[search_rule_name].append(match)
+                n_matches += 1
 
-                # Check for matches in file content using search rule pattern
-                file_content_matches = [(m.start(0), m.end(0)) for m in re.finditer(search_rule_pattern, file_content)]
-                if len(file_content_matches) == 0:
-                    continue    
-
-                # Iterate through matches
-                for file_content_match in file_content_matches: 
-
-                    match = file_content[file_content_match[0]:file_content_match[1]]
-
-                    # Check if file match string is in ignored matches
-                    if self.file_in_ignored_list(git_file, ignored_items, ignore_type = "matches", match = match.strip()):
-                        n_ignored += 1
-                        continue
-                                
-                    # Validate match
-                    if search_rule_name == "hetu" and not self.is_hetu(match):
-                        continue
-
-                    # Add match to results
-                    if git_file not in matches:
-                        matches[git_file] = {}
-                    if search_rule_name not in matches[git_file]:
-                        matches[git_file][search_rule_name] = []
-                    matches[git_file][search_rule_name].append(match)
-                    n_matches += 1
+        return file_matches, n_matches, n_ignored
 
-        self.log_scan_results(matches, n_matches, str(datetime.now() - start_time), n_ignored)
-        matches_found = n_matches > 0
-        if self.log_additional_info:
-            self.log_scan_status_info(matches_found)
 
-        if self.add_results_to_ignore and matches_found:
-            self.add_results_to_ignore_list(matches, ignored_items)
+    def skip_file(self, git_file: str) -> bool:
+        """ Check if file should be skipped without reading it, based on its extension and size.
 
-        return matches
+        Parameters
+        ----------
+        git_file
+            Path of the file.
+
+        Returns
+        -------
+        bool
+            Should the file be skipped or not?
+        """
+        if os.path.splitext(git_file)[1].lower() in BINARY_FILE_EXTENSIONS:
+            logger.debug(f"Skipping binary file: {git_file}")
+            return True
+        if self.max_file_size is not None:
+            try:
+                file_size = os.path.getsize(git_file)
+            except OSError:
+                return False
+            if file_size > self.max_file_size:
+                logger.debug(f"Skipping file larger than {self.max_file_size} bytes: {git_file}")
+                return True
+        return False
 
 
     def valid_search_rules(self) -> list:
@@ -289,6 +371,37 @@ class AhjoScan:
         return True
 
 
+    def compile_search_rules(self) -> list:
+        """ Compile the file path and search patterns of the search rules once before scanning the files.
+
+        Returns
+        -------
+        compiled_rules
+            List of tuples (rule name, compiled file path patterns, compiled search pattern).
+            Search pattern is None if the search rule has no pattern.
+        """
+        compiled_rules = []
+        for search_rule in self.search_rules:
+
+            search_rule_name = search_rule.get("name")
+            rule_filepaths = search_rule.get("filepath", ".")
+            if isinstance(rule_filepaths, str): rule_filepaths = [rule_filepaths]
+
+            # Get search rule pattern
+            search_rule_pattern = search_rule.get("pattern") # Custom search
+            if not search_rule_pattern:
+                search_rule_pattern = SEARCH_PATTERNS.get(search_rule_name)
+            if not search_rule_pattern:
+                logger.warning(f"Invalid search rule: {search_rule_name}. Search rule pattern not found.")
+
+            compiled_rules.append((
+                search_rule_name,
+                [re.compile(rule_filepath) for rule_filepath in rule_filepaths],
+                re.compile(search_rule_pattern) if search_rule_pattern else None
+            ))
+        return compiled_rules
+
+
     def add_placeholders_to_patterns(self):
         """ Add placeholders to search rule patterns."""
         for rule_indx, search_rule in enumerate(self.search_rules):
@@ -482,7 +595,7 @@ class AhjoScan:
         if os.path.exists(file_path) and os.path.isfile(file_path):
             try:
                 with open(file_path, 'r') as stream:
-                    ignored_items_yaml = yaml.load(stream, Loader=yaml.CLoader)
+                    ignored_items_yaml = yaml.load(stream, Loader=_YAML_LOADER)
                     
                 if ignored_items_yaml is not None and len(ignored_items_yaml) > 0:
                     for ignored_item in ignored_items_yaml:
@@ -520,13 +633,33 @@ class AhjoScan:
             Path to the file containing ignored results.
         """
         for file in matches:
-            if file not in ignored_items:
-                ignored_items[file] = {}
-                ignored_items[file]["matches"] = []
+            file_ignored_matches = ignored_items.setdefault(file, {}).setdefault("matches", [])
+            existing_matches = set(file_ignored_matches)
             for search_rule in matches[file]:
                 for match in matches[file][search_rule]:
-                    if match not in ignored_items[file]["matches"]:
-                        ignored_items[file]["matches"].append(match.strip())
-        with open(self.ignore_config_path, "w") as stream:
-            yaml.dump([{**{"file_path": file}, **ignored_items[file]} for file in ignored_items], stream, default_flow_style=False, sort_keys=False)
+                    match = match.strip()
+                    if match not in existing_matches:
+                        existing_matches.add(match)
+                        file_ignored_matches.append(match)
+
+        # Write the whole list to a temporary file and replace the ignore file with it,
+        # so that an interrupted write does not leave a partial ignore file behind
+        ignore_config_dir = os.path.dirname(os.path.abspath(self.ignore_config_path))
+        stream = tempfile.NamedTemporaryFile("w", dir = ignore_config_dir, suffix = ".tmp", delete = False)
+        try:
+            with stream:
+                yaml.dump([{**{"file_path": file}, **ignored_items[file]} for file in ignored_items], stream, default_flow_style=False, sort_keys=False)
+                stream.flush()
+                os.fsync(stream.fileno())
+            # Temporary files are created with mode 0600, keep the mode of the ignore file instead
+            if os.path.isfile(self.ignore_config_path):
+                shutil.copymode(self.ignore_config_path, stream.name)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(stream.name, 0o666 & ~umask)
+            os.replace(stream.name, self.ignore_config_path)
+        except:
+            os.unlink(stream.name)
+            raise
         logger.info(f"Results added to ignored list: {self.ignore_config_path}")
\ No newline at end of file
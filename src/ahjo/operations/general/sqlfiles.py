@@ -5,14 +5,15 @@
 
 """Module for SQL script file deploy and drop."""
 import re
-import networkx as nx
 
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
 from logging import getLogger
 from os import listdir, path
 from pathlib import Path
 from traceback import format_exc
-from typing import Any, Callable, Union
+from typing import Any, Callable, List, Tuple, Union
 
 from ahjo.interface_methods import rearrange_params
 from ahjo.database_utilities import execute_from_file, execute_try_catch, execute_files_in_transaction, drop_files_in_transaction, get_dialect_name
@@ -20,6 +21,7 @@ from ahjo.interface_methods import format_to_table
 from ahjo.operation_manager import OperationManager
 from sqlalchemy.engine import Engine, Connection
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import text
 
 logger = getLogger('ahjo')
 
@@ -199,6 +201,8 @@ def topological_sort(files: list, object_types: list = None) -> list:
     sorted_files
         List of file paths sorted based on dependencies.
     '''
+    import networkx as nx
+
     G = create_dependency_graph(files, object_types)
     sorted_files = list(reversed(list(nx.topological_sort(G))))
                 
@@ -223,6 +227,8 @@ def create_dependency_graph(data_src: Union[str, list], object_types: list = Non
     G
         NetworkX DiGraph object.
     '''
+    import networkx as nx
+
     G = nx.DiGraph()
     files = sql_files_found(data_src)
     objects_to_files = {}
@@ -401,39 +407,162 @@ def drop_sqlfile_objects(connectable: Union[Engine, Connection], object_type: st
         If any of the files in given directory/filelist fail to drop after multiple tries.
     """
     with OperationManager(message):
-   
-        error_msg = None
-        connectable_type = type(connectable)
+
         check_connectable_type(connectable, "drop_sqlfile_objects")
 
         files = sql_files_found(data_src)
-        n_files = len(files)
-        if n_files == 0: return False
+        if len(files) == 0: return False
 
-        if connectable_type == Engine:
-            failed, _ = sql_file_loop(
-                drop_sql_from_file, 
-                connectable,
-                object_type, 
-                file_list = files, 
-                max_loop = n_files
-            )
-            if len(failed) > 0:
-                error_msg = "Failed to drop the following files:\n{}".format('\n'.join(failed.keys()))
-                for fail_messages in failed.values():
-                    error_msg = error_msg + ''.join(fail_messages)
+        if type(connectable) == Engine:
+            with connectable.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT")
+                _drop_files_with_autocommit(connection, object_type, files)
         else:
-            try:
-                drop_queries = {}
-                for file in files:
-                    drop_queries[file] = drop_sql_query(file, object_type)
-                drop_files_in_transaction(connectable, drop_queries)
-            except:
-                error_msg = "Error occured while dropping files."
-                error_msg = error_msg + " \n " + format_exc()
+            _drop_files_in_transaction(connectable, object_type, files)
+
 
-        if error_msg is not None:
-            raise RuntimeError(error_msg)
+@rearrange_params({"engine": "connectable"})
+def drop_sqlfile_objects_batch(connectable: Union[Engine, Connection], sources: List[Tuple[str, Union[str, list], str]], 
+        dependencies: dict = None, max_workers: int = 1):
+    """Drop the objects of multiple SQL script file sources.
+
+    If connectable is Engine and dependencies are not given, one connection is opened for all the sources
+    instead of one connection per dropped file. If dependencies are given, sources that do not depend
+    on each other are dropped in parallel threads, each thread using a connection of its own.
+    If a source fails to drop, no new sources are started and the error is raised
+    after the sources being dropped have finished.
+    If connectable is Connection, the sources are dropped one by one using the given connection.
+
+    Parameters
+    ----------
+    connectable
+        SQL Alchemy engine or connection.
+    sources
+        List of (object_type, data_src, message) tuples. See drop_sqlfile_objects for details.
+        Without dependencies, the sources are dropped in the given order.
+    dependencies
+        Dictionary with data_src of a source as key and list of data_src values that must be
+        dropped before it as value. Sources missing from the dictionary have no dependencies.
+    max_workers
+        Maximum number of threads used for dropping the sources in parallel. Defaults to 1.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the files fail to drop.
+    """
+    check_connectable_type(connectable, "drop_sqlfile_objects_batch")
+
+    if type(connectable) != Engine:
+        for object_type, data_src, message in sources:
+            drop_sqlfile_objects(connectable, object_type, data_src, message)
+        return
+
+    if dependencies is not None:
+        _drop_sources_in_parallel(connectable, sources, dependencies, max_workers)
+        return
+
+    # Connection is opened when the first source with SQL files is found
+    connection = None
+    try:
+        for object_type, data_src, message in sources:
+            with OperationManager(message):
+                files = sql_files_found(data_src)
+                if len(files) > 0:
+                    if connection is None:
+                        connection = connectable.connect()
+                        connection.execution_options(isolation_level="AUTOCOMMIT")
+                    _drop_files_with_autocommit(connection, object_type, files)
+    finally:
+        if connection is not None:
+            connection.close()
+
+
+def _drop_sources_in_parallel(engine: Engine, sources: list, dependencies: dict, max_workers: int):
+    """Drop the sources in topological order of dependencies.
+    Sources with no pending dependencies are dropped concurrently.
+    """
+    sources_by_src = {data_src: (object_type, data_src, message) for object_type, data_src, message in sources}
+    sorter = TopologicalSorter()
+    for data_src in sources_by_src:
+        sorter.add(data_src, *[dep for dep in dependencies.get(data_src, []) if dep in sources_by_src])
+    sorter.prepare()
+
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        futures = {}
+        while sorter.is_active():
+            for data_src in sorter.get_ready():
+                futures[executor.submit(_drop_source_with_engine, engine, *sources_by_src[data_src])] = data_src
+            done, _ = wait(futures, return_when = FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    # Sources waiting for a free thread are not started
+                    executor.shutdown(cancel_futures = True)
+                    future.result()
+                sorter.done(futures.pop(future))
+
+
+def _drop_source_with_engine(engine: Engine, object_type: str, data_src: Union[str, list], message: str):
+    with OperationManager(message):
+        files = sql_files_found(data_src)
+        if len(files) > 0:
+            with engine.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT")
+                _drop_files_with_autocommit(connection, object_type, files)
+
+
+def _drop_files_with_autocommit(connection: Connection, object_type: str, files: list):
+    """Drop the objects of files using a connection in autocommit mode.
+    In MSSQL, all the DROP statements are sent in a single batch. In other dialects, the objects are dropped one by one.
+    Errors raised by the DROP statements are ignored (see drop_sql_from_file).
+    """
+    if get_dialect_name(connection) == "mssql":
+        failed = _drop_files_in_single_batch(connection, object_type, files)
+    else:
+        failed, _ = sql_file_loop(
+            _drop_sql_with_connection,
+            connection,
+            object_type,
+            file_list = files,
+            max_loop = len(files)
+        )
+    if len(failed) > 0:
+        error_msg = "Failed to drop the following files:\n{}".format('\n'.join(failed.keys()))
+        for fail_messages in failed.values():
+            error_msg = error_msg + ''.join(fail_messages)
+        raise RuntimeError(error_msg)
+
+
+def _drop_files_in_single_batch(connection: Connection, object_type: str, files: list) -> dict:
+    """(MSSQL) Drop the objects of files with one round-trip to the database.
+    Each DROP statement is wrapped in TRY...CATCH, so a failing statement is ignored and the rest are still executed.
+    Return the files, whose DROP statement could not be created, and related errors.
+    """
+    failed = {}
+    drop_statements = []
+    for file in files:
+        try:
+            drop_statements.append(f"BEGIN TRY {drop_sql_query(file, object_type)} END TRY BEGIN CATCH END CATCH;")
+        except:
+            failed[file] = ['\n------\n' + format_exc()]
+    if len(drop_statements) > 0:
+        connection.exec_driver_sql('\n'.join(drop_statements))
+    return failed
+
+
+def _drop_files_in_transaction(connection: Connection, object_type: str, files: list):
+    """Drop the objects of files in the open transaction of connection.
+    Rollback if any of the DROP statements fail.
+    """
+    try:
+        drop_queries = {}
+        for file in files:
+            drop_queries[file] = drop_sql_query(file, object_type)
+        drop_files_in_transaction(connection, drop_queries)
+    except:
+        error_msg = "Error occured while dropping files."
+        error_msg = error_msg + " \n " + format_exc()
+        raise RuntimeError(error_msg)
 
 
 @rearrange_params({"engine": "connectable"})
@@ -494,6 +623,17 @@ def drop_sql_from_file(file: str, engine: Engine, object_type: str):
     execute_try_catch(engine, query = drop_sql_query(file, object_type))
 
 
+def _drop_sql_with_connection(file: str, connection: Connection, object_type: str):
+    '''Run DROP OBJECT command for object in SQL script file using an autocommit connection.
+    Like in drop_sql_from_file, a failing DROP statement is ignored.
+    '''
+    query = drop_sql_query(file, object_type)
+    try:
+        connection.execute(text(query))
+    except:
+        logger.debug(f"Failed to execute: {query}")
+
+
 def drop_sql_query(file, object_type):
     parts = path.basename(file).split('.')
     # SQL files are assumed to be named in format: schema.object.sql
@@ -7,13 +7,16 @@ import copy
 import sys
 import os
 import ahjo.scripts.master_actions
-import networkx as nx
 import importlib
 from ahjo.interface_methods import load_conf, are_you_sure
 from ahjo.operations.general.git_version import _get_all_tags, _get_git_version, _get_previous_tag, _checkout_tag
 from ahjo.action import execute_action, import_actions, DEFAULT_ACTIONS_SRC
 from ahjo.context import Context
 from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 sys.path.append(os.getcwd())
@@ -61,6 +64,8 @@ class AhjoUpgrade:
         bool
             True if upgrade was successful, otherwise False.
         """
+        import networkx as nx
+
         try:
             # Load settings
             config = load_conf(self.config_filename)
@@ -257,7 +262,7 @@ class AhjoUpgrade:
         return next_upgrades_in_config[0]
 
 
-    def get_upgrade_version_path(self, tag_graph: nx.DiGraph, config_version_graph: nx.DiGraph, next_version_upgrade: str) -> list:
+    def get_upgrade_version_path(self, tag_graph: "nx.DiGraph", config_version_graph: "nx.DiGraph", next_version_upgrade: str) -> list:
         """Get ordered list of versions to upgrade. 
 
         Parameters
@@ -276,6 +281,7 @@ class AhjoUpgrade:
         list
             Ordered list of versions to upgrade.
         """
+        import networkx as nx
 
         # Check if there are no version gaps in the upgrade actions
         if not nx.is_weakly_connected(config_version_graph):
@@ -324,7 +330,7 @@ class AhjoUpgrade:
         return config_version_paths[0]
 
 
-    def create_version_dependency_graph(self, versions: set) -> nx.DiGraph:
+    def create_version_dependency_graph(self, versions: set) -> "nx.DiGraph":
         """Create a version dependency graph.
 
         Parameters
@@ -337,7 +343,8 @@ class AhjoUpgrade:
         nx.DiGraph
             Version dependency graph.
         """
-        
+        import networkx as nx
+
         G = nx.DiGraph()
         
         for version in versions:
@@ -351,7 +358,7 @@ class AhjoUpgrade:
         return G
 
 
-    def plot_version_dependency_graph(self, G: nx.DiGraph, current_version: str = None, upgrade_action_versions: list = None, layout: str = "spring") -> None:
+    def plot_version_dependency_graph(self, G: "nx.DiGraph", current_version: str = None, upgrade_action_versions: list = None, layout: str = "spring") -> None:
         """Plot the version dependency graph.
 
         Parameters
@@ -359,6 +366,7 @@ class AhjoUpgrade:
         G
             Version dependency graph.
         """
+        import networkx as nx
         plt = importlib.import_module("matplotlib.pyplot")
 
         if layout == "spring":
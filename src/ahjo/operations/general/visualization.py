@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 """ Module for visualization operations. """
-import networkx as nx
 from logging import getLogger
 
 try:
@@ -25,6 +24,8 @@ def plot_dependency_graph(G, layout: str = "spring_layout"):
         Layout algorithm for the graph. Default is "spring_layout".
         See https://networkx.github.io/documentation/stable/reference/drawing.html#module-networkx.drawing.layout
     """
+    import networkx as nx
+
     try:
         # Select layout
         if layout == "spring_layout":
@@ -5,8 +5,8 @@
 
 '''Module for database drop and create.
 
-Global variable QUERIES holds SQL select statements to
-retrieve session and database ids from database.'''
+Global variable QUERIES holds SQL statements to
+retrieve database ids and kill database sessions.'''
 from os import path
 from typing import Union
 
@@ -15,7 +15,22 @@ from ahjo.operation_manager import OperationManager
 from sqlalchemy.engine import Engine
 
 QUERIES = {
-    'get_db_session': 'SELECT session_id FROM sys.dm_exec_sessions WHERE database_id = :database_id',
+    'kill_db_sessions': """
+        SET NOCOUNT ON;
+        DECLARE @session_id INT, @kill_query NVARCHAR(50);
+        DECLARE session_cursor CURSOR LOCAL FAST_FORWARD FOR
+            SELECT session_id FROM sys.dm_exec_sessions WHERE database_id = :database_id;
+        OPEN session_cursor;
+        FETCH NEXT FROM session_cursor INTO @session_id;
+        WHILE @@FETCH_STATUS = 0
+        BEGIN
+            SET @kill_query = N'KILL ' + CAST(@session_id AS NVARCHAR(10));
+            EXEC sp_executesql @kill_query;
+            FETCH NEXT FROM session_cursor INTO @session_id;
+        END
+        CLOSE session_cursor;
+        DEALLOCATE session_cursor;
+        """,
     'get_db_id': 'SELECT db_id(:db_name)',
     'get_existing_db': 'SELECT name from sys.databases where name = :db_name'
 }
@@ -50,12 +65,11 @@ def create_db(engine: Engine, db_name: str, db_path: str, log_path: str, init_si
         '''Kill all connections to database and connections made by given login.
         Drop login and database.
         '''
-        session_ids = execute_query(
-            engine, QUERIES.get('get_db_session'),
+        # Sessions are killed server-side in one batch instead of one query per session
+        execute_query(
+            engine, QUERIES.get('kill_db_sessions'),
             variables={"database_id": database_id}
         )
-        for sid in session_ids:
-            execute_query(engine, f'KILL {sid.session_id}')
         execute_query(engine, f'DROP DATABASE [{db_name}]')
 
     def create_database():
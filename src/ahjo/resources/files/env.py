@@ -102,15 +102,19 @@ def run_migrations_online():
             token = conn_info.get("token"),
             **conn_info.get("sqla_engine_params")
         )
-        with connectable.connect() as connection:
-            context.configure(
-                connection=connection,
-                target_metadata=target_metadata,
-                version_table_schema=version_table_schema,
-                version_table=version_table
-            )
-            with context.begin_transaction():
-                context.run_migrations()
+        try:
+            with connectable.connect() as connection:
+                context.configure(
+                    connection=connection,
+                    target_metadata=target_metadata,
+                    version_table_schema=version_table_schema,
+                    version_table=version_table,
+                    transaction_per_migration=True
+                )
+                with context.begin_transaction():
+                    context.run_migrations()
+        finally:
+            connectable.dispose()
 
     else: # Use existing connection
 
@@ -99,7 +99,7 @@ def main():
         print(f"Error setting up logger: {str(error)}")
         sys.exit(1)
 
-    if not config_is_valid(config_path, non_interactive = non_interactive):
+    if not config_is_valid(context.configuration, non_interactive = non_interactive):
         sys.exit(1)
     
     if context.configuration.get("display_db_info", True) and action_affects_db(ahjo_action):
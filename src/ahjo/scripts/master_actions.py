@@ -9,11 +9,12 @@ The actions are imported to master.py, where they are executed.
 This file can be broken to multiple files, as long as every action is imported to
 'master.py' and create_multiaction-calls are made after the parts are already defined.
 """
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import partial
 from logging import getLogger
 
 import ahjo.operations as op
 import ahjo.database_utilities as du
-import networkx as nx
 from ahjo.action import action, create_multiaction, registered_actions
 from ahjo.operations.tsql.sqlfiles import deploy_mssql_sqlfiles
 from ahjo.operations.general.db_tester import DatabaseTester
@@ -25,17 +26,71 @@ from sqlalchemy.exc import NoSuchTableError
 
 logger = getLogger('ahjo')
 
-# Default column definitions for ahjo test table
-DEFAULT_TEST_TABLE_COLS = [
-    Column("batch_id", Integer),
-    Column("start_time", DateTime),
-    Column("end_time", DateTime, default=func.now()),
-    Column("test_name", String),
-    Column("issue", String),
-    Column("result", String),
-    Column("test_file", String)
+def default_test_table_cols() -> list:
+    """Return the default column definitions for ahjo test table.
+    New Column objects are created on every call, since a Column can be attached to one Table only.
+    """
+    return [
+        Column("batch_id", Integer),
+        Column("start_time", DateTime),
+        Column("end_time", DateTime, default=func.now()),
+        Column("test_name", String),
+        Column("issue", String),
+        Column("result", String),
+        Column("test_file", String)
+    ]
+
+# Object types and directories of the objects dropped in 'drop' and 'downgrade' actions
+DROP_SQLFILE_SOURCES = [
+    ('VIEW', "./database/views/", "Dropping views"),
+    ('PROCEDURE', "./database/procedures/", "Dropping procedures"),
+    ('FUNCTION', "./database/functions/", "Dropping functions"),
+    ('PROCEDURE', "./database/clr-procedures/", "Dropping CLR-procedures"),
+    ('ASSEMBLY', "./database/assemblies/", "Dropping assemblies")
 ]
 
+# Sources that must be dropped before each source. Independent sources are dropped in parallel.
+DROP_SQLFILE_DEPENDENCIES = {
+    "./database/functions/": ["./database/views/", "./database/procedures/"],
+    "./database/clr-procedures/": ["./database/procedures/"],
+    "./database/assemblies/": ["./database/clr-procedures/", "./database/functions/"]
+}
+
+
+def drop_sqlfile_sources(context, connectable):
+    """Drop the objects of DROP_SQLFILE_SOURCES. The number of threads used for dropping
+    independent sources in parallel is set with 'parallel_deploy_workers'. If it is 1 or less (default),
+    the sources are dropped one by one in the order of DROP_SQLFILE_SOURCES, which satisfies
+    DROP_SQLFILE_DEPENDENCIES.
+    """
+    max_workers = context.configuration.get("parallel_deploy_workers", 1)
+    op.drop_sqlfile_objects_batch(
+        connectable,
+        DROP_SQLFILE_SOURCES,
+        dependencies = DROP_SQLFILE_DEPENDENCIES if max_workers > 1 else None,
+        max_workers = max_workers
+    )
+
+
+def run_independent_tasks(context, connectable, tasks: list):
+    """Run tasks that do not depend on each other. If connectable is Engine and 'parallel_deploy_workers'
+    is greater than 1, the tasks are run in parallel threads, each task using connections of its own.
+    Otherwise (default) the tasks are run one by one. If a task fails, no new tasks are started
+    and the error is raised after the running tasks have finished.
+    """
+    max_workers = min(context.configuration.get("parallel_deploy_workers", 1), len(tasks))
+    if isinstance(connectable, Connection) or max_workers <= 1:
+        for task in tasks:
+            task()
+        return
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        done, _ = wait(futures, return_when = FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                executor.shutdown(cancel_futures = True)
+                future.result()
+
 
 @action(connection_required=False)
 def init_config(context):
@@ -117,31 +172,28 @@ def structure(context):
 def deploy(context):
     """(MSSQL) Run 'alembic upgrade head'. Deploy functions, views and prodecures. Update extended properties and Git version."""
     connectable = context.get_connectable()
-    
+    connection = connectable if isinstance(connectable, Connection) else None
+
     if not context.get_cli_arg("skip_alembic_update"):
-        op.upgrade_db_to_latest_alembic_version(
-            context.config_filename,
-            connection = context.get_connection() if type(connectable) == Connection else None
-        )
+        op.upgrade_db_to_latest_alembic_version(context.config_filename, connection = connection)
 
-    op.deploy_sqlfiles(context.get_connectable(), "./database/functions/", "Deploying functions")
-    op.deploy_sqlfiles(context.get_connectable(), "./database/views/", "Deploying views")
-    op.deploy_sqlfiles(context.get_connectable(), "./database/procedures/", "Deploying procedures")
+    op.deploy_sqlfiles(connectable, "./database/functions/", "Deploying functions")
+    op.deploy_sqlfiles(connectable, "./database/views/", "Deploying views")
+    op.deploy_sqlfiles(connectable, "./database/procedures/", "Deploying procedures")
 
+    # Git version and extended properties are stored to separate tables
+    post_deploy_tasks = []
     if not context.get_cli_arg("skip_git_update"):
-        op.update_git_version(
-            context.get_connectable(),
-            context.configuration.get('git_table_schema', 'dbo'),
-            context.configuration.get('git_table', 'git_version'),
-            repository = context.configuration.get('url_of_remote_git_repository'),
-            git_version_info_path = context.configuration.get('git_version_info_path')
-        )
+        post_deploy_tasks.append(partial(op.update_git_version, connectable, **context.get_git_version_params()))
 
     if not context.get_cli_arg("skip_metadata_update"):
-        op.update_db_object_properties(
-                context.get_connectable(),
+        post_deploy_tasks.append(partial(
+                op.update_db_object_properties,
+                connectable,
                 context.configuration.get('metadata_allowed_schemas')
-        )
+        ))
+
+    run_independent_tasks(context, connectable, post_deploy_tasks)
 
 
 @action(affects_database=True, dependencies=['init'])
@@ -150,32 +202,32 @@ def deploy_files(context, **kwargs):
 
     deploy_files = context.get_cli_arg("files")
 
-    if deploy_files is None:
+    if not deploy_files:
         logger.warning("No files to deploy. Check the 'files' argument.")
         return
 
+    connectable = context.get_connectable()
+    connection = connectable if isinstance(connectable, Connection) else None
+
     if not context.get_cli_arg("skip_alembic_update"):
-        op.upgrade_db_to_latest_alembic_version(context.config_filename)
+        op.upgrade_db_to_latest_alembic_version(context.config_filename, connection = connection)
 
-    op.deploy_sqlfiles(context.get_connectable(), deploy_files, "Deploying sql files")
+    op.deploy_sqlfiles(connectable, deploy_files, "Deploying sql files")
 
     if not context.get_cli_arg("skip_git_update"):
-        op.update_git_version(
-            context.get_connectable(),
-            context.configuration.get('git_table_schema', 'dbo'),
-            context.configuration.get('git_table', 'git_version'),
-            repository = context.configuration.get('url_of_remote_git_repository'),
-            git_version_info_path = context.configuration.get('git_version_info_path')
-        )
+        op.update_git_version(connectable, **context.get_git_version_params())
 
 
 @action(affects_database=True, dependencies=['init'])
 def assembly(context):
     """(MSSQL) Drop and deploy CLR-procedures and assemblies."""
-    op.drop_sqlfile_objects(context.get_connectable(), 'PROCEDURE', "./database/clr-procedures/", "Dropping CLR-procedures")
-    op.drop_sqlfile_objects(context.get_connectable(), 'ASSEMBLY', "./database/assemblies/", "Dropping assemblies")
-    op.deploy_sqlfiles(context.get_connectable(), "./database/assemblies/", "Deploying assemblies")
-    op.deploy_sqlfiles(context.get_connectable(), "./database/clr-procedures/", "Deploying CLR-procedures")
+    connectable = context.get_connectable()
+    op.drop_sqlfile_objects_batch(connectable, [
+        ('PROCEDURE', "./database/clr-procedures/", "Dropping CLR-procedures"),
+        ('ASSEMBLY', "./database/assemblies/", "Dropping assemblies")
+    ])
+    op.deploy_sqlfiles(connectable, "./database/assemblies/", "Deploying assemblies")
+    op.deploy_sqlfiles(connectable, "./database/clr-procedures/", "Deploying CLR-procedures")
 
 
 @action(affects_database=True, dependencies=['deploy'])
@@ -186,25 +238,13 @@ def data(context):
     deploy_args = [connectable, "./database/data/", "Inserting data"]
     deploy_mssql_sqlfiles(*deploy_args) if engine.name == "mssql" else op.deploy_sqlfiles(*deploy_args)
     if not context.get_cli_arg("skip_git_update"):
-        op.update_git_version(
-            connectable,
-            context.configuration.get('git_table_schema', 'dbo'),
-            context.configuration.get('git_table', 'git_version'),
-            repository = context.configuration.get('url_of_remote_git_repository'),
-            git_version_info_path = context.configuration.get('git_version_info_path')
-        )
+        op.update_git_version(connectable, **context.get_git_version_params())
 
 
 @action(affects_database=True, dependencies=['deploy'])
 def update_git_version(context):
     """Store the Git remote, branch and commit information to database."""
-    op.update_git_version(
-        context.get_connectable(),
-        context.configuration.get('git_table_schema', 'dbo'),
-        context.configuration.get('git_table', 'git_version'),
-        repository = context.configuration.get('url_of_remote_git_repository'),
-        git_version_info_path = context.configuration.get('git_version_info_path')
-    )
+    op.update_git_version(context.get_connectable(), **context.get_git_version_params())
 
 
 @action(affects_database=True, dependencies=['data'])
@@ -276,23 +316,19 @@ def add_users_to_roles(context):
 @action(affects_database=True, dependencies=["init"])
 def drop(context):
     """(MSSQL) Drop views, procedures, functions and clr-procedures."""
-    op.drop_sqlfile_objects(context.get_connectable(), 'VIEW', "./database/views/", "Dropping views")
-    op.drop_sqlfile_objects(context.get_connectable(), 'PROCEDURE', "./database/procedures/", "Dropping procedures")
-    op.drop_sqlfile_objects(context.get_connectable(), 'FUNCTION', "./database/functions/", "Dropping functions")
-    op.drop_sqlfile_objects(context.get_connectable(), 'PROCEDURE', "./database/clr-procedures/", "Dropping CLR-procedures")
-    op.drop_sqlfile_objects(context.get_connectable(), 'ASSEMBLY', "./database/assemblies/", "Dropping assemblies")
+    drop_sqlfile_sources(context, context.get_connectable())
 
 
 @action(affects_database=True, dependencies=["init"])
 def drop_files(context, **kwargs):
     """(MSSQL) Drop sql file objects."""
-    files = kwargs["files"] if "files" in kwargs else None
-    if not(isinstance(files, list) and len(files) > 0):
+    files = kwargs.get("files")
+    if not isinstance(files, list) or not files:
         logger.warning('Check variable: "files".')
         return
-        
-    object_type = kwargs["object_type"] if "object_type" in kwargs else None
-    if not(isinstance(object_type, str) and len(object_type) > 0):
+
+    object_type = kwargs.get("object_type")
+    if not isinstance(object_type, str) or not object_type:
         logger.warning('Check variable: "object_type".')
         return
 
@@ -312,12 +348,9 @@ def drop_obsolete(context):
 def downgrade(context):
     """(MSSQL) Drop views, procedures, functions and clr-procedures. Run 'alembic downgrade'."""
     connectable = context.get_connectable()
-    op.drop_sqlfile_objects(connectable, 'VIEW', "./database/views/", "Dropping views")
-    op.drop_sqlfile_objects(connectable, 'PROCEDURE', "./database/procedures/", "Dropping procedures")
-    op.drop_sqlfile_objects(connectable, 'FUNCTION', "./database/functions/", "Dropping functions")
-    op.drop_sqlfile_objects(connectable, 'PROCEDURE', "./database/clr-procedures/", "Dropping CLR-procedures")
-    op.drop_sqlfile_objects(connectable, 'ASSEMBLY', "./database/assemblies/", "Dropping assemblies")
-    op.downgrade_db_to_alembic_base(context.config_filename, connection = context.get_connection() if type(connectable) == Connection else None)
+    connection = connectable if isinstance(connectable, Connection) else None
+    drop_sqlfile_sources(context, connectable)
+    op.downgrade_db_to_alembic_base(context.config_filename, connection = connection)
 
 
 @action()
@@ -327,20 +360,17 @@ def test(context):
     metadata = MetaData()
     connectable = context.get_connectable()
     test_table = None
+    save_test_results_to_db = context.configuration.get("save_test_results_to_db", False)
 
-    if context.configuration.get("save_test_results_to_db", False):
+    if save_test_results_to_db:
 
-        test_table_name = context.configuration.get("test_table_name", "ahjo_tests")
-        test_table_schema = context.configuration.get("test_table_schema", "dbo")
+        test_table_params = context.get_test_table_params()
+        test_table_name = test_table_params["test_table_name"]
+        test_table_schema = test_table_params["test_table_schema"]
 
         try:
             # Load existing test table
-            test_table = Table(
-                test_table_name,
-                metadata, 
-                autoload_with = connectable, 
-                schema = test_table_schema
-            )
+            test_table = context.reflect_table(test_table_name, schema = test_table_schema)
         except NoSuchTableError:
             if context.configuration.get("create_test_table_if_not_exists", True):
                 logger.debug(f"Test table not found. Creating new test table.")
@@ -348,7 +378,7 @@ def test(context):
                 test_table = Table(
                     test_table_name,
                     metadata,
-                    *DEFAULT_TEST_TABLE_COLS,
+                    *default_test_table_cols(),
                     schema = test_table_schema
                 )
                 metadata.create_all(connectable)
@@ -361,7 +391,7 @@ def test(context):
     db_tester = DatabaseTester(
         connectable, 
         table = test_table, 
-        save_test_results_to_db = context.configuration.get("save_test_results_to_db", False)
+        save_test_results_to_db = save_test_results_to_db
     )
     db_tester.execute_test_files("./database/tests/")
 
@@ -372,12 +402,13 @@ def create_test_table(context):
     try:
         metadata = MetaData()
         connectable = context.get_connectable()
-        test_table_name = context.configuration.get("test_table_name", "ahjo_tests")
-        test_table_schema = context.configuration.get("test_table_schema", "dbo")
+        test_table_params = context.get_test_table_params()
+        test_table_name = test_table_params["test_table_name"]
+        test_table_schema = test_table_params["test_table_schema"]
         test_table = Table(
             test_table_name,
             metadata,
-            *DEFAULT_TEST_TABLE_COLS,
+            *default_test_table_cols(),
             schema = test_table_schema
         )
         metadata.create_all(connectable, checkfirst=False)
@@ -392,16 +423,15 @@ def create_test_view(context):
     """Create test view for test results."""
     try:
         connectable = context.get_connectable()
-        view_name = context.configuration.get("test_view_name", "vwAhjoTests")
-        view_schema = context.configuration.get("test_view_schema", "dbo")
+        test_table_params = context.get_test_table_params()
+        view_name = test_table_params["test_view_name"]
+        view_schema = test_table_params["test_view_schema"]
         metadata = MetaData()
 
         # Load table for view
-        test_table = Table(
-            context.configuration.get("test_table_name", "ahjo_tests"),
-            MetaData(),
-            autoload_with = connectable,
-            schema = context.configuration.get("test_table_schema", "dbo")
+        test_table = context.reflect_table(
+            test_table_params["test_table_name"],
+            schema = test_table_params["test_table_schema"]
         )
 
         # Create view
@@ -430,13 +460,15 @@ def create_test_view(context):
 @action(dependencies=["deploy"])
 def version(context):
     """Print Git and Alembic version."""
+    connectable = context.get_connectable()
+    git_version_params = context.get_git_version_params()
     op.print_git_version(
-        context.get_connectable(),
-        context.configuration.get('git_table_schema', 'dbo'),
-        context.configuration.get('git_table', 'git_version')
+        connectable,
+        git_version_params['git_table_schema'],
+        git_version_params['git_table']
     )
     op.print_alembic_version(
-        context.get_connectable(),
+        connectable,
         context.configuration['alembic_version_table']
     )
 
@@ -462,6 +494,8 @@ def update_db_obj_prop(context):
 @action()
 def plot_dependencies(context, **kwargs):
     """(MSSQL) Plot dependency graph."""
+    import networkx as nx
+
     deploy_files = context.get_cli_arg("files")
     cl_layout = context.get_cli_arg("layout")
     if isinstance(deploy_files, list) and len(deploy_files) == 0:
@@ -8,7 +8,6 @@
 '''
 
 import argparse
-from ahjo.operations.general.multi_project_build import run_multi_project_build
 
 def main():
     parser = argparse.ArgumentParser()
@@ -16,11 +15,12 @@ def main():
     parser.add_argument('-c', '--confirm', action='store_true', help='Ask for confirmation for ahjo actions.')
     args = parser.parse_args()
 
+    # Imported after argument parsing, so that --help does not load SQLAlchemy and alembic
+    from ahjo.operations.general.multi_project_build import run_multi_project_build
+
     info_msg = "Ahjo multi-project build"
     line = "-" * len(info_msg)
-    print(line)
-    print(info_msg)
-    print(line)
+    print(f"{line}\n{info_msg}\n{line}")
 
     run_multi_project_build(
         args.config_filename,
@@ -7,14 +7,34 @@
     Ahjo scan command entrypoint.
 '''
 import argparse
+import multiprocessing
+import os
+import re
 import sys
-from ahjo.operations.general.scan import AhjoScan
+from logging import getLogger
 from ahjo.interface_methods import load_yaml_conf
-from ahjo.logging import setup_ahjo_logger
+from ahjo.util.git import _get_files_to_scan, _get_rule_filepaths
+
+logger = getLogger('ahjo')
+
+def _no_staged_files_to_scan(search_rules: list) -> bool:
+    """ Check without loading the scan module whether none of the staged files match the file paths of the search rules.
+    Used by the pre-commit hook to skip the scan when the commit contains no files to scan.
+    Staged files are listed with the same helper as in AhjoScan.get_files_to_scan. On any error, the check returns False and the scan is run normally.
+    """
+    try:
+        filepath_patterns = [re.compile(rule_filepath) for rule_filepath in _get_rule_filepaths(search_rules)]
+        staged_files = _get_files_to_scan(search_rules, scan_staging_area = True)
+    except Exception:
+        return False
+    return not any(pattern.search(staged_file) for staged_file in staged_files for pattern in filepath_patterns)
 
-logger = setup_ahjo_logger(enable_database_log = False)
 
 def main():
+    # Worker processes of the scan start by running the frozen executable (ahjo-scan.exe) again.
+    # freeze_support makes them run the worker code instead of the command line interface.
+    multiprocessing.freeze_support()
+
     parser = argparse.ArgumentParser()
     parser.add_argument("-r", "--search-rules", required=False, help="Path to ahjo scan rules config file.", default="ahjo_scan_rules.yaml")
     parser.add_argument("-ig", "--ignore-config", required=False, help="Path to ahjo scan ignore config file.", default="ahjo_scan_ignore.yaml")
@@ -24,7 +44,23 @@ def main():
     )
     parser.add_argument("-in", "--init", action="store_true", required=False, help="Initialize config files for scan rules and ignored scan results.")
     parser.add_argument("-ai", "--add-results-to-ignore", action="store_true", required=False, help="Add found scan results to ignore config file.", default=False)
+    parser.add_argument("-w", "--workers", type=int, required=False, help="Number of processes used for scanning the files.", default=1)
+    parser.add_argument("-ms", "--max-file-size", type=int, required=False, help="Skip files larger than this (in bytes).", default=None)
     args = parser.parse_args()
+
+    # Pre-commit hook: skip loading the scan and logging setup if none of the staged files need to be scanned
+    if args.quiet and args.stage and not args.init and os.path.isfile(args.search_rules):
+        scan_config = load_yaml_conf(args.search_rules)
+        if isinstance(scan_config, list) and len(scan_config) > 0 and _no_staged_files_to_scan(scan_config):
+            sys.exit(0)
+
+    # Imported after argument parsing, so that --help does not load SQLAlchemy
+    from ahjo.operations.general.scan import AhjoScan
+    from ahjo.logging import setup_ahjo_logger
+
+    # Configure logging only when the command is run, not when the module is imported
+    setup_ahjo_logger(enable_database_log = False)
+
     quiet_mode = args.quiet
     ignore_config_path = args.ignore_config
     rules_config_path = args.search_rules
@@ -36,7 +72,9 @@ def main():
         log_additional_info = False if quiet_mode else True,
         ignore_config_path = ignore_config_path,
         scan_rules_file = rules_config_path,
-        add_results_to_ignore = args.add_results_to_ignore
+        add_results_to_ignore = args.add_results_to_ignore,
+        workers = args.workers,
+        max_file_size = args.max_file_size
     )
 
     if args.init:
@@ -52,7 +90,7 @@ def main():
 
     matches = ahjo_scan.scan_project()
 
-    sys.exit(1) if (len(matches) > 0 if matches else False) else sys.exit(0)
+    sys.exit(1 if matches else 0)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -9,12 +9,7 @@
 
 import argparse
 import sys
-from ahjo.operations.general.upgrade import AhjoUpgrade
-from ahjo.operations.general.db_info import print_db_collation
-from ahjo.database_utilities.sqla_utilities import test_connection
-from ahjo.context import Context, config_is_valid
-from ahjo.logging import setup_ahjo_logger
-from ahjo.interface_methods import get_config_path, load_conf
+from ahjo.interface_methods import get_config_path
 
 info_msg = "Ahjo upgrade-project"
 line = "-" * len(info_msg)
@@ -30,16 +25,23 @@ def main():
     parser.add_argument("-p", "--plot", action="store_true", help="Plot the database schema.", required=False, default=False)
     args = parser.parse_args()
 
+    # Imported after argument parsing, so that --help does not load SQLAlchemy and alembic
+    from ahjo.operations.general.upgrade import AhjoUpgrade
+    from ahjo.operations.general.db_info import print_db_collation
+    from ahjo.database_utilities.sqla_utilities import test_connection
+    from ahjo.context import Context, config_is_valid
+    from ahjo.logging import setup_ahjo_logger
+
     config_filename = get_config_path(args.config_filename)
-    config_dict = load_conf(config_filename)
     non_interactive = args.non_interactive
-    if not config_is_valid(config_dict, non_interactive = non_interactive):
-        sys.exit(1)
 
     # Create context
     context = Context(config_filename)
     context.set_enable_transaction(False)
 
+    if not config_is_valid(context.configuration, non_interactive = non_interactive):
+        sys.exit(1)
+
     if context.configuration.get("connect_resiliently", True):
         test_connection(
             engine = context.get_engine(),
@@ -0,0 +1,54 @@
+# Ahjo - Database deployment framework
+#
+# Copyright 2019 - 2024 ALM Partners Oy
+# SPDX-License-Identifier: Apache-2.0
+
+"""Module for listing files with Git, including the files scanned by ahjo scan.
+Kept free of SQLAlchemy and other heavy imports, so that the pre-commit hook can use it without loading them.
+"""
+from subprocess import check_output
+
+
+def _get_files_in_staging_area(paths: list = None) -> list:
+    """ Retrieve files in staging area, except deleted files, with a single 'git diff' command.
+    Renamed and copied files are included with their new names.
+    File names are NUL-separated (-z), so that git does not quote paths with special characters.
+    """
+    command = ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=d"]
+    if isinstance(paths, list) and len(paths) > 0:
+        command.extend(["--", *paths])
+    return [file for file in check_output(command).decode("utf-8").split("\0") if file]
+
+
+def _get_files_in_working_directory(path: list = None) -> list:
+    """ Retrieve all files of the current commit with 'git ls-tree' command.
+    File names are NUL-separated (-z), so that git does not quote paths with special characters.
+    """
+    command = ["git", "ls-tree", "-r", "--name-only", "-z", "HEAD"]
+    if isinstance(path, list) and len(path) > 0:
+        command.extend(["--", *path])
+    return [file for file in check_output(command).decode("utf-8").split("\0") if file]
+
+
+def _get_rule_filepaths(search_rules: list) -> list:
+    """ Collect the file paths of the scan search rules, without duplicates and in the order of the rules.
+    A rule without a file path matches all files (".").
+    """
+    filepaths = []
+    for rule in search_rules:
+        rule_filepath = rule.get("filepath")
+        if isinstance(rule_filepath, str):
+            filepaths.append(rule_filepath)
+        elif isinstance(rule_filepath, list):
+            filepaths.extend(rule_filepath)
+        else:
+            filepaths.append(".")
+    return list(dict.fromkeys(filepaths))
+
+
+def _get_files_to_scan(search_rules: list, scan_staging_area: bool = False) -> list:
+    """ Retrieve the files in staging area or working directory that are in the file paths of the scan search rules. """
+    filepaths = _get_rule_filepaths(search_rules)
+    if scan_staging_area:
+        return _get_files_in_staging_area(filepaths)
+    return _get_files_in_working_directory(filepaths)
@@ -3,7 +3,7 @@
 Notice that MSSQL user must have permissions to master db
 tox -- --mssql_host localhost --mssql_port 14330 --mssql_username sa --mssql_password SALA_kala12
 """
-from subprocess import check_output
+from subprocess import SubprocessError, run
 
 import pytest
 from sqlalchemy import create_engine
@@ -110,7 +110,15 @@ def pytest_collection_modifyitems(config, items):
 def ensure_mssql_ready_for_tests(config):
     """Test connection to MSSQL instance
     and check the existence of database AHJO_TEST.
+    The result is stored in config, so that the check is done only once per session.
     """
+    if not hasattr(config, "_ahjo_mssql_ready"):
+        config._ahjo_mssql_ready = _check_mssql_connection(config)
+    return config._ahjo_mssql_ready
+
+
+def _check_mssql_connection(config):
+    engine = None
     try:
         if not config.getoption('mssql_host'):
             raise Exception('MSSQL Server not given')
@@ -132,16 +140,17 @@ def ensure_mssql_ready_for_tests(config):
             if result.fetchall():
                 raise Exception(f"There already exists a database with name '{TEST_DB_NAME}'")
         return True
-    except:
+    except Exception:
         return False
+    finally:
+        if engine is not None:
+            engine.dispose()
 
 
 def check_if_git_is_installed():
     """Check if GIT is installed by calling 'git --version'."""
     try:
-        git_version = check_output(["git", "--version"]).decode('utf-8')
-        if git_version.startswith("git version"):
-            return True
-        raise Exception('Git not installed')
-    except:
+        result = run(["git", "--version"], capture_output=True, text=True, timeout=10, check=False)
+    except (OSError, SubprocessError):
         return False
+    return result.returncode == 0 and result.stdout.startswith("git version")
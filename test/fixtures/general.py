@@ -15,8 +15,11 @@ def new_sample(prepared_sample):
 import csv
 from argparse import Namespace
 from base64 import b64encode
+from collections import namedtuple
+from copy import deepcopy
 from shutil import copytree
 from os import environ, getcwd, path
+from subprocess import CalledProcessError, check_output
 
 import json
 import pytest
@@ -27,6 +30,7 @@ from sqlalchemy import MetaData, Table
 
 PROJECT_ROOT = getcwd()
 SAMPLE_DATA_DIR = './database/data'
+GitHeadInfo = namedtuple('GitHeadInfo', ['remote', 'branch', 'commit'])
 
 
 @pytest.fixture(scope='session')
@@ -39,17 +43,36 @@ def git_setup(project_root):
     environ["GIT_DIR"] = path.join(project_root, '.git')
 
 
+@pytest.fixture(scope='session')
+def git_head_info(git_setup):
+    """Return remote url, branch and commit of the current Git HEAD.
+    Git is called once per session, since HEAD does not change during the test run.
+    """
+    try:
+        remote = check_output(["git", "remote", "get-url", "origin"]).decode('utf-8').strip()
+    except CalledProcessError:
+        remote = None
+    return GitHeadInfo(
+        remote = remote,
+        branch = check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"]).decode('utf-8').strip(),
+        commit = check_output(["git", "describe", "--always", "--tags"]).decode('utf-8').strip()
+    )
+
+
 @pytest.fixture(scope='session')
 def ahjo_config():
     """Return read sample Ahjo config.
     This fixture is used when creating engine fixture.
+    The config of each sample is read once per session and a copy is returned to the caller.
     """
+    sample_configs = {}
     def read_samples_ahjo_config(sample_directory):
-        sample_config = path.join(sample_directory, 'config_development.json')
-        with open(sample_config) as f:
-            config = json.load(f)
-            config = config['BACKEND']
-        return config
+        if sample_directory not in sample_configs:
+            sample_config = path.join(sample_directory, 'config_development.json')
+            with open(sample_config) as f:
+                config = json.load(f)
+                sample_configs[sample_directory] = config['BACKEND']
+        return deepcopy(sample_configs[sample_directory])
     return read_samples_ahjo_config
 
 
@@ -1,5 +1,5 @@
-from os import listdir, path
-from re import DOTALL, sub
+from os import scandir
+import re
 
 import pytest
 from ahjo.database_utilities import create_sqlalchemy_engine
@@ -9,8 +9,14 @@ from sqlalchemy.sql import text
 VIEWS_DIR = './database/views'
 PROC_DIR = './database/procedures'
 FUNC_DIR = './database/functions'
-MSSQL_COMMENTS = [r'/\*.+?\*/', r'--.[ \S]+?\n']
-MSSQL_BATCH_SEP = '\nGO'
+MSSQL_COMMENTS = [re.compile(r'/\*.+?\*/', re.DOTALL), re.compile(r'--.[ \S]+?\n', re.DOTALL)]
+MSSQL_BATCH_SEP = re.compile(r'^[ \t]*GO[ \t]*$', re.MULTILINE | re.IGNORECASE)
+
+
+def list_sql_files(directory):
+    """Return directory entries of the files in a sample object directory."""
+    with scandir(directory) as entries:
+        return [entry for entry in entries if entry.is_file()]
 
 
 @pytest.fixture(scope='session')
@@ -46,7 +52,9 @@ def mssql_master_engine(request, ahjo_config, mssql_sample):
         database='master',
         query=query
     )
-    return create_sqlalchemy_engine(connection_url)
+    engine = create_sqlalchemy_engine(connection_url)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture(scope='session')
@@ -71,7 +79,9 @@ def mssql_engine(request, ahjo_config, mssql_sample):
         database=config['target_database_name'],
         query=query
     )
-    return create_sqlalchemy_engine(connection_url)
+    engine = create_sqlalchemy_engine(connection_url)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture(scope='session')
@@ -90,14 +100,8 @@ def mssql_setup_and_teardown(mssql_master_engine, test_db_name):
     with mssql_master_engine.connect() as connection:
         connection.execution_options(isolation_level="AUTOCOMMIT")
         with connection.begin():
-            result = connection.execute(
-                text('SELECT session_id FROM sys.dm_exec_sessions WHERE database_id = DB_ID(:test_db_name)'), {"test_db_name": test_db_name}
-                )
-            for row in result.fetchall():
-                try:
-                    connection.execute(text(f'KILL {row.session_id}'))
-                except:
-                    pass
+            # Roll back and disconnect other sessions of the test database in the same statement
+            connection.execute(text(f'ALTER DATABASE {test_db_name} SET SINGLE_USER WITH ROLLBACK IMMEDIATE'))
             connection.execute(text(f'DROP DATABASE {test_db_name}'))
 
 
@@ -105,25 +109,22 @@ def mssql_setup_and_teardown(mssql_master_engine, test_db_name):
 def deploy_mssql_objects():
     """When executing, CWD must be set correctly to sample root!"""
     def deploy_objects(engine):
-        w_files = [path.join(VIEWS_DIR, f) for f in listdir(VIEWS_DIR)]
-        p_files = [path.join(PROC_DIR, f) for f in listdir(PROC_DIR)]
-        f_files = [path.join(FUNC_DIR, f) for f in listdir(FUNC_DIR)]
-        files = w_files + p_files + f_files
+        files = [entry.path for object_dir in (VIEWS_DIR, PROC_DIR, FUNC_DIR) for entry in list_sql_files(object_dir)]
     
-        for tsql in files:
-            with open(tsql, 'r', encoding='utf-8-sig') as f:
-                t_sql = f.read()
-            for comment in MSSQL_COMMENTS:
-                t_sql = sub(comment, '', t_sql, flags=DOTALL)
-            batches = t_sql.split(MSSQL_BATCH_SEP)
+        with engine.connect() as connection:
+            connection.execution_options(isolation_level='AUTOCOMMIT')
+            for tsql in files:
+                with open(tsql, 'r', encoding='utf-8-sig') as f:
+                    t_sql = f.read()
+                for comment in MSSQL_COMMENTS:
+                    t_sql = comment.sub('', t_sql)
+                batches = MSSQL_BATCH_SEP.split(t_sql)
     
-            with engine.connect() as connection:
-                connection.execution_options(isolation_level='AUTOCOMMIT')
                 with connection.begin():
                     for batch in batches:
-                        if not batch:
+                        if not batch.strip():
                             continue
-                        batch = sub(':', r'\:', batch)
+                        batch = batch.replace(':', r'\:')
                         connection.execute(text(batch))
     return deploy_objects
 
@@ -132,14 +133,15 @@ def deploy_mssql_objects():
 def drop_mssql_objects():
     """When executing, CWD must be set correctly to sample root!"""
     def drop_objects(engine):
-        w_objects = [f"VIEW [{f.split('.')[0]}].[{f.split('.')[1]}]" for f in listdir(VIEWS_DIR)]
-        p_objects = [f"PROCEDURE [{f.split('.')[0]}].[{f.split('.')[1]}]" for f in listdir(PROC_DIR)]
-        f_objects = [f"FUNCTION [{f.split('.')[0]}].[{f.split('.')[1]}]" for f in listdir(FUNC_DIR)]
-        database_objects = w_objects + p_objects + f_objects
+        database_objects = [
+            f"{object_type} [{entry.name.split('.')[0]}].[{entry.name.split('.')[1]}]"
+            for object_type, object_dir in (("VIEW", VIEWS_DIR), ("PROCEDURE", PROC_DIR), ("FUNCTION", FUNC_DIR))
+            for entry in list_sql_files(object_dir)
+        ]
     
-        for db_object in database_objects:
-            with engine.connect() as connection:
-                connection.execution_options(isolation_level='AUTOCOMMIT')
-                with connection.begin():
-                    connection.execute(text(f"BEGIN TRY DROP {db_object} END TRY BEGIN CATCH END CATCH"))
+        drop_script = "\n".join(f"BEGIN TRY DROP {db_object} END TRY BEGIN CATCH END CATCH;" for db_object in database_objects)
+        with engine.connect() as connection:
+            connection.execution_options(isolation_level='AUTOCOMMIT')
+            with connection.begin():
+                connection.execute(text(drop_script))
     return drop_objects
@@ -94,16 +94,20 @@ def run_migrations_online():
         **conn_info.get("sqla_engine_params")
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-			version_table_schema=version_table_schema,
-			version_table=version_table
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+    try:
+        with connectable.connect() as connection:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                version_table_schema=version_table_schema,
+                version_table=version_table,
+                transaction_per_migration=True
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
@@ -23,6 +23,14 @@ def test_file_to_batches_should_raise_error_if_file_is_not_utf_8_bom(mssql_sampl
         ahjo._file_to_batches("mssql", sql_file, None)
 
 
+def test_file_to_batches_should_reparse_modified_file(tmp_path):
+    sql_file = tmp_path / 'batches.sql'
+    sql_file.write_text("SELECT 1\nGO\nSELECT 2", encoding='utf-8')
+    assert len(ahjo._file_to_batches("mssql", str(sql_file), None)) == 2
+    sql_file.write_text("SELECT 1\nGO\nSELECT 2\nGO\nSELECT 3", encoding='utf-8')
+    assert len(ahjo._file_to_batches("mssql", str(sql_file), None)) == 3
+
+
 @pytest.mark.mssql
 class TestWithSQLServer():
     @pytest.fixture(scope='function', autouse=True)
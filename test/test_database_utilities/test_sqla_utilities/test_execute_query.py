@@ -2,10 +2,18 @@ from os import chdir, getcwd
 
 import ahjo.database_utilities.sqla_utilities as ahjo
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.exc import DBAPIError, ProgrammingError
 from sqlalchemy.sql import text
 
 
+def test_execute_in_batches_should_raise_error_when_row_count_is_not_available():
+    engine = create_engine("sqlite://")
+    with pytest.raises(ValueError):
+        ahjo.execute_in_batches(engine, query="SELECT :batch_size")
+    engine.dispose()
+
+
 @pytest.mark.mssql
 class TestWithPopulatedSQLServer():
 
@@ -133,3 +141,22 @@ class TestWithPopulatedSQLServer():
             result = connection.execute(text(query)).fetchall()
         assert result[0] == ('Test_1', '112')
         assert result[1] == ('Test_2', '112')
+
+    def test_execute_in_batches_should_update_all_rows(self):
+        affected_rows = ahjo.execute_in_batches(
+            self.engine,
+            query="UPDATE TOP (:batch_size) store.Clients SET phone = :phone WHERE phone IS NULL OR phone <> :phone",
+            variables={'phone': '113'},
+            batch_size=2
+        )
+        result = ahjo.execute_query(self.engine, query="SELECT COUNT(*) FROM store.Clients WHERE phone <> '113'")
+        assert affected_rows > 0
+        assert result[0][0] == 0
+
+    def test_execute_in_batches_should_raise_error_with_nocount(self):
+        with pytest.raises(ValueError):
+            ahjo.execute_in_batches(
+                self.engine,
+                query="SET NOCOUNT ON; UPDATE TOP (:batch_size) store.Clients SET phone = '113' WHERE phone IS NULL OR phone <> '113'",
+                batch_size=2
+            )
@@ -0,0 +1,39 @@
+import ahjo.interface_methods as ahjo
+
+
+def test_format_to_table_should_return_no_output_for_empty_list():
+    assert ahjo.format_to_table([]) == 'No output.'
+
+
+def test_format_to_table_should_pad_columns_to_widest_cell():
+    table = ahjo.format_to_table([('name', 'zip_code'), ('Matti', 180), (None, '02100')])
+    assert table == (
+        'name   zip_code  \n'
+        'Matti  180       \n'
+        'None   02100     \n'
+    )
+
+
+def test_format_to_table_should_keep_all_cells_of_uneven_rows():
+    table = ahjo.format_to_table([['a', 'b', 'c'], [1, 2, 3], ['only']])
+    assert table == (
+        'a     b  c  \n'
+        '1     2  3  \n'
+        'only  \n'
+    )
+
+
+def test_load_conf_should_not_share_cached_configuration(tmp_path):
+    conf_file = tmp_path / "config.yaml"
+    conf_file.write_text("BACKEND:\n  allowed_actions: ALL\n")
+    config = ahjo.load_conf(str(conf_file))
+    config["allowed_actions"] = []
+    assert ahjo.load_conf(str(conf_file)) == {"allowed_actions": "ALL"}
+
+
+def test_load_conf_should_reload_modified_file(tmp_path):
+    conf_file = tmp_path / "config.json"
+    conf_file.write_text('{"BACKEND": {"allowed_actions": "ALL"}}')
+    assert ahjo.load_conf(str(conf_file)) == {"allowed_actions": "ALL"}
+    conf_file.write_text('{"BACKEND": {"allowed_actions": ["deploy"]}}')
+    assert ahjo.load_conf(str(conf_file)) == {"allowed_actions": ["deploy"]}
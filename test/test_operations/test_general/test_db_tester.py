@@ -2,7 +2,7 @@ import pytest
 import datetime
 from os import chdir, getcwd
 from ahjo.operations.general.db_tester import DatabaseTester
-from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, text, func
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, text, func, create_engine
 
 TABLE_NAME = "test_table"
 SCHEMA = "dbo"
@@ -137,4 +137,37 @@ class TestDBTesterWithSQLServer():
         with self.engine.connect() as connection:
             result = connection.execute(reflected_table.select())
             rows = result.fetchall()
-        assert len(rows) == 0
\ No newline at end of file
+        assert len(rows) == 0
+
+class TestDBTesterWithSQLite():
+
+    @pytest.fixture(scope='function', autouse=True)
+    def db_tester_sqlite_setup(self):
+        self.engine = create_engine("sqlite://")
+        metadata = MetaData()
+        self.test_table = Table(
+            TABLE_NAME,
+            metadata,
+            Column("batch_id", Integer),
+            Column("test_name", String),
+            Column("result", String),
+            Column("test_file", String)
+        )
+        metadata.create_all(self.engine)
+        self.db_tester = DatabaseTester(self.engine, self.test_table, save_test_results_to_db = True)
+        yield
+        self.engine.dispose()
+
+    def test_save_results_to_db_should_insert_rows_of_all_files(self):
+        self.db_tester.save_results_to_db({
+            "a.sql": [["test_name", "result"], ["test_1", "OK"], ["test_2", "OK"]],
+            "b.sql": [["test_name", "result"], ["test_3", "FAILED"]],
+            "c.sql": [["test_name", "result"]]
+        })
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(f"SELECT batch_id, test_name, result, test_file FROM {TABLE_NAME}")).fetchall()
+        assert rows == [
+            (1, "test_1", "OK", "a.sql"),
+            (1, "test_2", "OK", "a.sql"),
+            (2, "test_3", "FAILED", "b.sql")
+        ]
@@ -2,8 +2,9 @@ import ahjo.operations.general.git_version as git
 import logging
 import pytest
 from ahjo.interface_methods import load_conf
+from ahjo.util.git import _get_files_in_staging_area
 from os import environ, path
-from subprocess import check_output
+from subprocess import run
 from sqlalchemy import Column, MetaData, String, Table, select
 from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.sql import text
@@ -31,6 +32,30 @@ def test_update_git_version_should_skip_when_no_connection(caplog):
     assert "Failed to update Git version table. See log for detailed error message." in caplog.text
 
 
+@pytest.fixture(scope='function')
+def git_repository(tmp_path, monkeypatch):
+    """Initialize an empty Git repository to tmp_path and set it as CWD."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    run(["git", "init", "-q"], check=True)
+    run(["git", "config", "user.email", "test@example.com"], check=True)
+    run(["git", "config", "user.name", "test"], check=True)
+    return tmp_path
+
+
+@pytest.mark.git
+def test_files_in_staging_area_should_contain_renamed_file(git_repository):
+    (git_repository / "a.sql").write_text("SELECT 1\n")
+    (git_repository / "c.sql").write_text("SELECT 3\n")
+    run(["git", "add", "."], check=True)
+    run(["git", "commit", "-q", "-m", "init"], check=True)
+    run(["git", "mv", "a.sql", "b.sql"], check=True)
+    (git_repository / "b.sql").write_text("SELECT 2\n")
+    run(["git", "rm", "-q", "c.sql"], check=True)
+    run(["git", "add", "b.sql"], check=True)
+    assert _get_files_in_staging_area() == ["b.sql"]
+
+
 @pytest.mark.mssql
 class TestWithSQLServer():
 
@@ -70,7 +95,7 @@ class TestWithSQLServer():
 
     def get_commit_info_from_git_table(self):
         git_version_table = self.reflected_git_table()
-        with self.engine.begin() as connection:
+        with self.engine.connect() as connection:
             result = connection.execute(
                 select(
                     git_version_table.c.Repository,
@@ -78,7 +103,7 @@ class TestWithSQLServer():
                     git_version_table.c.Commit,
                     git_version_table.c.Timestamp
                 ))
-            return result.fetchall()[0]
+            return result.first()
 
     def assert_git_version_table_results(self, row, repository, branch, commit):
         assert row.Repository == repository
@@ -98,13 +123,13 @@ class TestWithSQLServer():
         self.git_version_table_should_exist()
 
     @pytest.mark.git
-    def test_git_version_table_should_store_commit_after_update(self):
+    def test_git_version_table_should_store_commit_after_update(self, git_head_info):
         git.update_git_version(self.engine, self.git_table_schema, self.git_table)
         self.assert_git_version_table_results(
             self.get_commit_info_from_git_table(), 
-            check_output(["git", "remote", "get-url", "origin"]).decode('utf-8').strip(), 
-            check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"]).decode('utf-8').strip(), 
-            check_output(["git", "describe", "--always", "--tags"]).decode('utf-8').strip()
+            git_head_info.remote, 
+            git_head_info.branch, 
+            git_head_info.commit
         )
 
     @pytest.mark.git
@@ -121,14 +146,14 @@ class TestWithSQLServer():
         )
 
     @pytest.mark.git
-    def test_git_version_table_should_store_repository_from_ahjo_config(self):
+    def test_git_version_table_should_store_repository_from_ahjo_config(self, git_head_info):
         git.update_git_version(self.engine, self.git_table_schema,
                                self.git_table, self.sample_repository)
         self.assert_git_version_table_results(
             self.get_commit_info_from_git_table(),
             self.sample_repository,
-            check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"]).decode('utf-8').strip(),
-            check_output(["git", "describe", "--always", "--tags"]).decode('utf-8').strip()
+            git_head_info.branch,
+            git_head_info.commit
         )
 
     @pytest.mark.git
@@ -182,19 +207,15 @@ class TestWithSQLServer():
         assert 'Timestamp' in git_version_table_columns
 
     @pytest.mark.git
-    def test_correct_git_version_should_be_printed(self, caplog):
+    def test_correct_git_version_should_be_printed(self, caplog, git_head_info):
         git.update_git_version(self.engine, self.git_table_schema,
                                self.git_table, self.sample_repository)
-        git_branch = check_output(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"]).decode('utf-8').strip()
-        git_commit = check_output(
-            ["git", "describe", "--always", "--tags"]).decode('utf-8').strip()
         caplog.set_level(logging.INFO)
         git.print_git_version(self.engine, self.git_table_schema, self.git_table)
         log_output = caplog.text
         assert f"Repository: {self.sample_repository}" in log_output
-        assert f"Branch: {git_branch}" in log_output
-        assert f"Version: {git_commit}" in log_output
+        assert f"Branch: {git_head_info.branch}" in log_output
+        assert f"Version: {git_head_info.commit}" in log_output
 
     @pytest.mark.git
     @pytest.mark.nopipeline
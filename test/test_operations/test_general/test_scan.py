@@ -1,4 +1,7 @@
+import stat
+
 import pytest
+import yaml
 from ahjo.operations.general.scan import AhjoScan, DEFAULT_SCAN_RULES
 
 VALID_HETUS = [
@@ -69,3 +72,70 @@ class TestAhjoScan():
     def test_valid_search_rules_should_return_false_for_invalid_type(self):
         self.ahjo_scan.search_rules = 123
         assert self.ahjo_scan.valid_search_rules() is False
+
+    def test_skip_file_should_return_true_for_binary_extension(self):
+        assert self.ahjo_scan.skip_file("database/assemblies/Assembly.dll") is True
+
+    def test_skip_file_should_return_true_for_file_larger_than_max_file_size(self, tmp_path):
+        sql_file = tmp_path / "data.sql"
+        sql_file.write_text("x" * 100)
+        self.ahjo_scan.max_file_size = 10
+        assert self.ahjo_scan.skip_file(str(sql_file)) is True
+
+    def test_skip_file_should_return_false_for_text_file(self, tmp_path):
+        sql_file = tmp_path / "data.sql"
+        sql_file.write_text("x" * 100)
+        assert self.ahjo_scan.skip_file(str(sql_file)) is False
+
+    def test_scan_file_should_find_hetu(self, tmp_path):
+        sql_file = tmp_path / "data.sql"
+        sql_file.write_text(f"SELECT '{VALID_HETUS[0]}'")
+        compiled_rules = self.ahjo_scan.compile_search_rules()
+        file_matches, n_matches, _ = self.ahjo_scan.scan_file(str(sql_file), compiled_rules, {})
+        assert file_matches == {"hetu": [VALID_HETUS[0]]}
+        assert n_matches == 1
+
+    def test_scan_file_should_skip_file_with_null_bytes(self, tmp_path):
+        sql_file = tmp_path / "data.sql"
+        sql_file.write_text(f"\x00SELECT '{VALID_HETUS[0]}'")
+        compiled_rules = self.ahjo_scan.compile_search_rules()
+        file_matches, n_matches, _ = self.ahjo_scan.scan_file(str(sql_file), compiled_rules, {})
+        assert file_matches == {}
+        assert n_matches == 0
+
+    def test_add_results_to_ignore_list_should_write_each_match_once(self, tmp_path):
+        self.ahjo_scan.ignore_config_path = str(tmp_path / "ahjo_scan_ignore.yaml")
+        ignored_items = {"database/data.sql": {"rules": ["email"]}}
+        matches = {"database/data.sql": {"hetu": [VALID_HETUS[0] + " ", VALID_HETUS[0], VALID_HETUS[1]]}}
+        self.ahjo_scan.add_results_to_ignore_list(matches, ignored_items)
+        assert self.ahjo_scan.load_ignored_items() == {
+            "database/data.sql": {"rules": ["email"], "matches": [VALID_HETUS[0], VALID_HETUS[1]]}
+        }
+        assert [f.name for f in tmp_path.iterdir()] == ["ahjo_scan_ignore.yaml"]
+
+    def test_add_results_to_ignore_list_should_keep_file_mode(self, tmp_path):
+        ignore_file = tmp_path / "ahjo_scan_ignore.yaml"
+        ignore_file.write_text("")
+        ignore_file.chmod(0o644)
+        self.ahjo_scan.ignore_config_path = str(ignore_file)
+        self.ahjo_scan.add_results_to_ignore_list({"database/data.sql": {"hetu": [VALID_HETUS[0]]}}, {})
+        assert stat.S_IMODE(ignore_file.stat().st_mode) == 0o644
+
+    def test_add_results_to_ignore_list_should_remove_temporary_file_on_error(self, tmp_path, monkeypatch):
+        self.ahjo_scan.ignore_config_path = str(tmp_path / "ahjo_scan_ignore.yaml")
+        def failing_dump(*args, **kwargs):
+            raise yaml.YAMLError("dump failed")
+        monkeypatch.setattr(yaml, "dump", failing_dump)
+        with pytest.raises(yaml.YAMLError):
+            self.ahjo_scan.add_results_to_ignore_list({"database/data.sql": {"hetu": [VALID_HETUS[0]]}}, {})
+        assert list(tmp_path.iterdir()) == []
+
+    def test_scan_file_should_skip_ignored_matches(self, tmp_path):
+        sql_file = tmp_path / "data.sql"
+        sql_file.write_text(f"SELECT '{VALID_HETUS[0]}', '{VALID_HETUS[1]}', '{VALID_HETUS[2]}'")
+        ignored_items = {str(sql_file): {"matches": [VALID_HETUS[0], f"'{VALID_HETUS[1]}'"]}}
+        compiled_rules = self.ahjo_scan.compile_search_rules()
+        file_matches, n_matches, n_ignored = self.ahjo_scan.scan_file(str(sql_file), compiled_rules, ignored_items)
+        assert file_matches == {"hetu": [VALID_HETUS[2]]}
+        assert n_matches == 1
+        assert n_ignored == 2
@@ -0,0 +1,134 @@
+from os import chdir, getcwd
+
+import ahjo.operations.general.sqlfiles as sqlfiles
+
+import pytest
+from ahjo.operations.general.sqlfiles import deploy_sqlfiles, drop_sqlfile_objects, drop_sqlfile_objects_batch
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.sql import text
+
+
+class TestSqlFilesWithSQLite():
+
+    @pytest.fixture(scope='function', autouse=True)
+    def sqlfiles_sqlite_setup(self, tmp_path):
+        self.engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+        self.tables_dir = tmp_path / "tables"
+        self.views_dir = tmp_path / "views"
+        self.tables_dir.mkdir()
+        self.views_dir.mkdir()
+        (self.tables_dir / "main.Clients.sql").write_text("CREATE TABLE Clients (id INTEGER, name TEXT);")
+        (self.views_dir / "main.vwClients.sql").write_text("CREATE VIEW vwClients AS SELECT name FROM Clients;")
+        yield
+        self.engine.dispose()
+
+    def deploy_tables_and_views(self):
+        deploy_sqlfiles(self.engine, str(self.tables_dir), "Creating tables")
+        deploy_sqlfiles(self.engine, str(self.views_dir), "Creating views")
+
+    def test_drop_sqlfile_objects_batch_should_drop_all_sources(self):
+        self.deploy_tables_and_views()
+        drop_sqlfile_objects_batch(self.engine, [
+            ("VIEW", str(self.views_dir), "Dropping views"),
+            ("TABLE", str(self.tables_dir), "Dropping tables")
+        ])
+        inspector = inspect(self.engine)
+        assert inspector.get_view_names() == []
+        assert inspector.get_table_names() == []
+
+    def test_drop_sqlfile_objects_batch_should_ignore_missing_objects(self):
+        drop_sqlfile_objects_batch(self.engine, [
+            ("VIEW", str(self.views_dir), "Dropping views")
+        ])
+        assert inspect(self.engine).get_view_names() == []
+
+    def test_drop_sqlfile_objects_batch_should_not_open_connection_without_sql_files(self, tmp_path):
+        empty_dir = tmp_path / "empty"
+        empty_dir.mkdir()
+        checkouts = []
+        event.listen(self.engine, "checkout", lambda *args: checkouts.append(args))
+        drop_sqlfile_objects_batch(self.engine, [
+            ("VIEW", str(empty_dir), "Dropping nothing"),
+            ("VIEW", str(tmp_path / "missing"), "Dropping nothing")
+        ])
+        assert checkouts == []
+
+    def test_drop_sqlfile_objects_batch_should_use_one_connection(self):
+        self.deploy_tables_and_views()
+        checkouts = []
+        event.listen(self.engine, "checkout", lambda *args: checkouts.append(args))
+        drop_sqlfile_objects_batch(self.engine, [
+            ("VIEW", str(self.views_dir), "Dropping views"),
+            ("TABLE", str(self.tables_dir), "Dropping tables")
+        ])
+        assert len(checkouts) == 1
+
+    def test_drop_sqlfile_objects_batch_should_drop_in_dependency_order(self):
+        self.deploy_tables_and_views()
+        drop_sqlfile_objects_batch(self.engine, [
+            ("TABLE", str(self.tables_dir), "Dropping tables"),
+            ("VIEW", str(self.views_dir), "Dropping views")
+        ], dependencies = {str(self.tables_dir): [str(self.views_dir)]})
+        inspector = inspect(self.engine)
+        assert inspector.get_view_names() == []
+        assert inspector.get_table_names() == []
+
+
+class TestDropSqlfileObjectsBatchWithDependencies():
+
+    @pytest.fixture(scope='function', autouse=True)
+    def drop_batch_setup(self, monkeypatch):
+        self.engine = create_engine("sqlite://")
+        self.dropped = []
+        self.failing = set()
+        def drop_source(engine, object_type, data_src, message):
+            if data_src in self.failing:
+                raise RuntimeError(f"Failed to drop {data_src}")
+            self.dropped.append(data_src)
+        monkeypatch.setattr(sqlfiles, "_drop_source_with_engine", drop_source)
+        self.sources = [
+            ("TABLE", "tables", "Dropping tables"),
+            ("VIEW", "views", "Dropping views"),
+            ("FUNCTION", "functions", "Dropping functions")
+        ]
+        self.dependencies = {"tables": ["views", "functions"], "functions": ["views"]}
+        yield
+        self.engine.dispose()
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_should_drop_dependents_before_dependencies(self, max_workers):
+        drop_sqlfile_objects_batch(self.engine, self.sources, dependencies = self.dependencies, max_workers = max_workers)
+        assert self.dropped == ["views", "functions", "tables"]
+
+    def test_should_not_drop_sources_depending_on_failed_source(self):
+        self.failing.add("functions")
+        with pytest.raises(RuntimeError):
+            drop_sqlfile_objects_batch(self.engine, self.sources, dependencies = self.dependencies, max_workers = 2)
+        assert self.dropped == ["views"]
+
+
+@pytest.mark.mssql
+class TestSqlFilesWithSQLServer():
+
+    @pytest.fixture(scope='function', autouse=True)
+    def sqlfiles_mssql_setup_and_teardown(self, mssql_sample, mssql_engine, run_alembic_action, deploy_mssql_objects, drop_mssql_objects):
+        self.engine = mssql_engine
+        old_cwd = getcwd()
+        chdir(mssql_sample)
+        run_alembic_action('upgrade', 'head')
+        deploy_mssql_objects(self.engine)
+        yield
+        drop_mssql_objects(self.engine)
+        run_alembic_action('downgrade', 'base')
+        with self.engine.begin() as connection:
+            connection.execute(text("DROP TABLE dbo.alembic_version"))
+        chdir(old_cwd)
+
+    def test_drop_sqlfile_objects_should_drop_views(self):
+        drop_sqlfile_objects(self.engine, "VIEW", "./database/views/", "Dropping views")
+        assert inspect(self.engine).get_view_names(schema = "store") == []
+
+    def test_drop_sqlfile_objects_should_ignore_missing_objects(self):
+        drop_sqlfile_objects(self.engine, "VIEW", "./database/views/", "Dropping views")
+        drop_sqlfile_objects(self.engine, "VIEW", "./database/views/", "Dropping views")
+        assert inspect(self.engine).get_view_names(schema = "store") == []
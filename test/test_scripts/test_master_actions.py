@@ -0,0 +1,62 @@
+import threading
+from types import SimpleNamespace
+
+import ahjo.operations as op
+import pytest
+from ahjo.scripts.master_actions import (DROP_SQLFILE_DEPENDENCIES, DROP_SQLFILE_SOURCES,
+                                         drop_sqlfile_sources, run_independent_tasks)
+from sqlalchemy import create_engine
+
+
+class TestDropSqlfileSources():
+
+    @pytest.fixture(scope='function', autouse=True)
+    def drop_sqlfile_sources_setup(self, monkeypatch):
+        self.engine = create_engine("sqlite://")
+        self.calls = []
+        def drop_batch(connectable, sources, dependencies = None, max_workers = 1):
+            self.calls.append({"sources": sources, "dependencies": dependencies, "max_workers": max_workers})
+        monkeypatch.setattr(op, "drop_sqlfile_objects_batch", drop_batch)
+        yield
+        self.engine.dispose()
+
+    def test_should_drop_sequentially_by_default(self):
+        drop_sqlfile_sources(SimpleNamespace(configuration = {}), self.engine)
+        assert self.calls == [{"sources": DROP_SQLFILE_SOURCES, "dependencies": None, "max_workers": 1}]
+
+    def test_should_drop_sequentially_with_one_worker(self):
+        drop_sqlfile_sources(SimpleNamespace(configuration = {"parallel_deploy_workers": 1}), self.engine)
+        assert self.calls[0]["dependencies"] is None
+
+    def test_should_drop_in_parallel_with_many_workers(self):
+        drop_sqlfile_sources(SimpleNamespace(configuration = {"parallel_deploy_workers": 3}), self.engine)
+        assert self.calls == [{"sources": DROP_SQLFILE_SOURCES, "dependencies": DROP_SQLFILE_DEPENDENCIES, "max_workers": 3}]
+
+
+def test_drop_sqlfile_sources_order_should_satisfy_dependencies():
+    order = [data_src for _, data_src, _ in DROP_SQLFILE_SOURCES]
+    for data_src, dependencies in DROP_SQLFILE_DEPENDENCIES.items():
+        for dependency in dependencies:
+            assert order.index(dependency) < order.index(data_src)
+
+
+def test_run_independent_tasks_should_run_in_calling_thread_with_one_worker():
+    engine = create_engine("sqlite://")
+    threads = []
+    tasks = [lambda: threads.append(threading.current_thread()) for _ in range(3)]
+    run_independent_tasks(SimpleNamespace(configuration = {"parallel_deploy_workers": 1}), engine, tasks)
+    assert threads == [threading.main_thread()] * 3
+    engine.dispose()
+
+
+def test_run_independent_tasks_should_not_start_new_tasks_after_failure():
+    engine = create_engine("sqlite://")
+    started = []
+    def failing_task():
+        started.append("failing")
+        raise RuntimeError("Task failed")
+    tasks = [failing_task] + [lambda: started.append("other") for _ in range(3)]
+    with pytest.raises(RuntimeError):
+        run_independent_tasks(SimpleNamespace(configuration = {"parallel_deploy_workers": 1}), engine, tasks)
+    assert started == ["failing"]
+    engine.dispose()
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import ahjo
+import pytest
+from ahjo.scripts.scan_project import _no_staged_files_to_scan
+
+SEARCH_RULES = [{"name": "hetu", "filepath": ["database/"]}]
+
+
+@pytest.fixture
+def git_project(tmp_path, monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising = False)
+    subprocess.run(["git", "init", "-q"], cwd = tmp_path, check = True)
+    (tmp_path / "ahjo_scan_rules.yaml").write_text("- name: hetu\n  filepath:\n  - database/\n")
+    (tmp_path / "database").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def stage_file(project: Path, filepath: str, content: str):
+    (project / filepath).write_text(content)
+    subprocess.run(["git", "add", filepath], cwd = project, check = True)
+
+
+def run_scan(project: Path) -> int:
+    env = dict(os.environ, PYTHONPATH = str(Path(ahjo.__file__).parents[1]))
+    return subprocess.run(
+        [sys.executable, "-m", "ahjo.scripts.scan_project", "--quiet", "--stage"],
+        cwd = project, env = env, capture_output = True
+    ).returncode
+
+
+def test_no_staged_files_to_scan_should_return_true_if_no_staged_file_matches(git_project):
+    stage_file(git_project, "README.md", "010105A991P")
+    assert _no_staged_files_to_scan(SEARCH_RULES) is True
+
+
+def test_no_staged_files_to_scan_should_return_false_if_staged_file_matches(git_project):
+    stage_file(git_project, "database/data.sql", "SELECT 1")
+    assert _no_staged_files_to_scan(SEARCH_RULES) is False
+
+
+def test_scan_should_exit_with_0_if_no_staged_file_matches(git_project):
+    stage_file(git_project, "README.md", "010105A991P")
+    assert run_scan(git_project) == 0
+
+
+def test_scan_should_exit_with_1_if_staged_file_matches(git_project):
+    stage_file(git_project, "database/data.sql", "SELECT '010105A991P'")
+    assert run_scan(git_project) == 1